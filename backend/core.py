@@ -1,15 +1,41 @@
 from __future__ import annotations
 
 import collections
+import functools
+import json
 import math
 import threading
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
+import orjson
 import visidata
 
+# Cell types that are already JSON-safe as they are
+_JSON_SAFE_TYPES = frozenset((str, int, bool, type(None)))
+
+# Number of serialized get_rows pages kept per dataset
+_PAGE_CACHE_SIZE = 32
+
+# Rows read between load_dataset progress callbacks
+_LOAD_PROGRESS_ROWS = 100_000
+
+# Rows serialized per chunk when streaming a slice as NDJSON
+_NDJSON_CHUNK_ROWS = 256
+
+# Placeholder for cells that could not be read
+_MISSING = object()
+
+# API names of the plain Python column types
+_TYPE_NAMES = {
+    int: "integer",
+    float: "float",
+    str: "string",
+    bool: "boolean",
+}
+
 
 @dataclass
 class ColumnInfo:
@@ -19,6 +45,40 @@ class ColumnInfo:
     width: int | None = None
 
 
+@dataclass(frozen=True)
+class _View:
+    """
+    Immutable snapshot of the visible rows and the sort/filter behind them.
+
+    Writers replace the handle's view wholesale and never modify a
+    published rows list in place. Each view carries its own page cache,
+    so a new view starts with an empty one.
+    """
+    rows: list[Any]
+    sort: tuple[str, bool] | None = None
+    filter: tuple[str, str] | None = None
+    pages: collections.OrderedDict[tuple, Any] = field(default_factory=collections.OrderedDict, compare=False)  # LRU of serialized pages and state
+
+    def cached_page(self, key: tuple) -> Any:
+        """Return a cached page (or None), marking it most recently used."""
+        page = self.pages.get(key)
+        if page is not None:
+            try:
+                self.pages.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by a concurrent reader
+        return page
+
+    def cache_page(self, key: tuple, page: Any) -> None:
+        """Cache a page, evicting the least recently used one when full."""
+        self.pages[key] = page
+        if len(self.pages) > _PAGE_CACHE_SIZE:
+            try:
+                self.pages.popitem(last=False)
+            except KeyError:
+                pass
+
+
 @dataclass
 class DatasetHandle:
     """
@@ -30,23 +90,73 @@ class DatasetHandle:
     sheet: Any  # visidata.Sheet
     path: str
     _lock: threading.RLock = field(default_factory=threading.RLock)
-    _original_rows: list[Any] | None = field(default=None, init=False)
+    _original_rows: list[Any] = field(default_factory=list, init=False)  # rows in load order, never modified
     _current_sort: tuple[str, bool] | None = field(default=None, init=False)  # (column_name, ascending)
     _current_filter: tuple[str, str] | None = field(default=None, init=False)  # (column_name, search_term)
+    _sort_result: list[Any] | None = field(default=None, init=False)  # rows list produced by the last sort
     _stats_cache: dict[str, Any] = field(default_factory=dict, init=False)
     _sample_rows: list[Any] | None = field(default=None, init=False)
+    _col_by_name: dict[str, Any] = field(default_factory=dict, init=False)  # column name -> VisiData column
+    _column_info: list[ColumnInfo] | None = field(default=None, init=False)  # cached get_columns() result
+    _columns_payload: list[dict[str, Any]] | None = field(default=None, init=False)  # cached get_columns_payload() result
+    _columns_json: str | None = field(default=None, init=False)  # cached get_columns_json() result
+    _lowered: dict[str, list[str | None]] = field(default_factory=dict, init=False)  # column name -> lowercased text of _original_rows
+    _view: _View | None = field(default=None, init=False)  # published snapshot for lock-free readers
+
+    def __post_init__(self) -> None:
+        # Writers always assign a new list to sheet.rows, so the loaded
+        # list can be kept as the load order without copying it
+        self._original_rows = self.sheet.rows
+        self._index_columns()
+        self._publish()
+
+    def _publish(self) -> None:
+        """
+        Publish the current rows and sort/filter state as a new snapshot.
+
+        Called by writers (under the lock) once an operation is complete.
+        Readers pick up the snapshot with a single attribute read, so they
+        never wait for a long sort or filter to finish.
+        """
+        self._view = _View(self.sheet.rows, self._current_sort, self._current_filter)
+
+    def _index_columns(self) -> None:
+        """Rebuild the name -> column lookup (first column wins on duplicates)."""
+        self._col_by_name = {}
+        for col in self.sheet.columns:
+            self._col_by_name.setdefault(col.name, col)
+        self._column_info = None
+        self._columns_payload = None
+        self._columns_json = None
+
+    def _lowered_values(self, col: Any) -> list[str | None]:
+        """
+        Return the lowercased text of a column for every original row.
+
+        Built on the first filter of a column and reused by the following
+        ones, so search-as-you-type only pays for the `in` test. Rows whose
+        value cannot be read are stored as None.
+        """
+        lowered = self._lowered.get(col.name)
+        if lowered is None:
+            lowered = []
+            for row in self._original_rows:
+                try:
+                    lowered.append(str(col.getValue(row)).lower())
+                except Exception:
+                    lowered.append(None)
+            self._lowered[col.name] = lowered
+        return lowered
 
     @property
     def row_count(self) -> int:
         """Total number of rows in the dataset."""
-        with self._lock:
-            return len(self.sheet.rows)
+        return len(self._view.rows)
 
     @property
     def column_count(self) -> int:
         """Total number of columns in the dataset."""
-        with self._lock:
-            return len(self.sheet.columns)
+        return len(self.sheet.columns)
 
     def get_columns(self) -> list[ColumnInfo]:
         """
@@ -56,16 +166,49 @@ class DatasetHandle:
         for JSON serialization.
         """
         with self._lock:
-            columns = []
-            for col in self.sheet.columns:
-                # Map VisiData type to string representation
-                type_name = _get_type_name(col.type)
-                columns.append(ColumnInfo(
-                    name=col.name,
-                    type=type_name,
-                    width=getattr(col, 'width', None)
-                ))
-            return columns
+            # Column metadata only changes on rename/retype; build it once
+            if self._column_info is None:
+                self._column_info = [
+                    ColumnInfo(
+                        name=col.name,
+                        # Map VisiData type to string representation
+                        type=_get_type_name(col.type),
+                        width=getattr(col, 'width', None)
+                    )
+                    for col in self.sheet.columns
+                ]
+            return list(self._column_info)
+
+    def get_columns_payload(self) -> list[dict[str, Any]]:
+        """
+        Return get_columns() as the list of dicts sent to API clients.
+
+        Cached until the next rename/retype; the list is shared between
+        callers and must not be modified.
+        """
+        with self._lock:
+            if self._columns_payload is None:
+                self._columns_payload = [
+                    {"name": c.name, "type": c.type, "width": c.width}
+                    for c in self.get_columns()
+                ]
+            return self._columns_payload
+
+    def get_columns_json(self) -> str:
+        """
+        Return get_columns_payload() encoded as a compact JSON array.
+
+        Cached until the next rename/retype, so metadata endpoints can
+        splice it into their response without re-encoding it.
+        """
+        with self._lock:
+            if self._columns_json is None:
+                self._columns_json = json.dumps(
+                    self.get_columns_payload(),
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                )
+            return self._columns_json
 
     def get_rows(self, start: int = 0, limit: int = 50) -> dict[str, Any]:
         """
@@ -74,131 +217,125 @@ class DatasetHandle:
         Returns:
             Dict with 'header' (list of col names) and 'rows' (list of lists of values).
         """
-        with self._lock:
-            rows = self.sheet.rows[start:start + limit]
-            columns = self.sheet.columns
+        # Read from the published snapshot; no lock needed. Pages are
+        # cached per view, so any sort/filter/schema change starts afresh
+        view = self._view
+        key = (start, limit)
+        page = view.cached_page(key)
+        if page is None:
+            page = self._build_page(view.rows, start, limit)
+            view.cache_page(key, page)
+        return page
+
+    def get_rows_columnar(self, start: int = 0, limit: int = 50) -> dict[str, Any]:
+        """
+        Return a slice of rows as one value list per column.
 
-            header = [c.name for c in columns]
-            result_rows = []
-            
-            # Optimization: Pre-calculate column indices for fast access
-            col_indices = []
-            for col in columns:
-                if hasattr(col, 'expr') and isinstance(col.expr, int):
-                    col_indices.append((col.expr, True))
-                else:
-                    col_indices.append((col, False))
+        Returns:
+            Dict with 'header' (list of col names) and 'columns' (one list of
+            values per column, in header order). Skips the transpose into
+            rows that get_rows() does.
+        """
+        view = self._view
+        key = ("columnar", start, limit)
+        page = view.cached_page(key)
+        if page is None:
+            header, col_values = self._page_columns(view.rows, start, limit)
+            page = {"header": header, "columns": col_values}
+            view.cache_page(key, page)
+        return page
+
+    def get_rows_json(self, start: int = 0, limit: int = 50, columnar: bool = False) -> bytes:
+        """
+        Return get_rows() (or get_rows_columnar()) already encoded as a JSON object.
 
-            for row in rows:
-                row_values = []
-                is_list_row = isinstance(row, list)
-                
-                for col_or_idx, is_index in col_indices:
-                    try:
-                        if is_list_row and is_index:
-                            val = row[col_or_idx]
-                            row_values.append(_serialize_value(val))
-                        else:
-                            col = col_or_idx
-                            value = col.getTypedValue(row)
-                            row_values.append(_serialize_value(value))
-                    except Exception:
-                        col = col_or_idx if not is_index else next(c for c in columns if c.expr == col_or_idx)
-                        row_values.append(col.getDisplayValue(row))
-                result_rows.append(row_values)
-                
-            return {
-                "header": header,
-                "rows": result_rows
-            }
+        The encoded bytes are cached next to the page, so the API layer
+        can return a repeated page without encoding it again.
+        """
+        view = self._view
+        key = ("json-columnar" if columnar else "json", start, limit)
+        data = view.cached_page(key)
+        if data is None:
+            page = self.get_rows_columnar(start, limit) if columnar else self.get_rows(start, limit)
+            data = encode_json(page)
+            view.cache_page(key, data)
+        return data
+
+    def iter_rows_ndjson(self, start: int = 0, limit: int = 50) -> Iterator[bytes]:
+        """
+        Yield a slice of rows as newline-delimited JSON.
 
-    def sort_by_column(self, column_name: str, ascending: bool = True) -> None:
+        The first line holds the header and the slice bounds; every other
+        line is one row. Rows are serialized a chunk at a time from a
+        single view snapshot, so a large slice is never held fully
+        serialized in memory.
+        """
+        view_rows = self._view.rows
+        end = min(start + limit, len(view_rows))
+        header = [c.name for c in self.sheet.columns]
+        yield encode_json({"header": header, "start": start, "limit": limit, "total": len(view_rows)}) + b"\n"
+        for offset in range(start, end, _NDJSON_CHUNK_ROWS):
+            page = self._build_page(view_rows, offset, min(_NDJSON_CHUNK_ROWS, end - offset))
+            yield b"".join(encode_json(row) + b"\n" for row in page["rows"])
+
+    def _page_columns(self, view_rows: list[Any], start: int, limit: int) -> tuple[list[str], list[list[Any]]]:
+        """Serialize one page of a view's rows column by column."""
+        rows = view_rows[start:start + limit]
+        columns = list(self.sheet.columns)
+        header = [c.name for c in columns]
+
+        # Serialize column by column so type dispatch happens once per
+        # column instead of once per cell
+        list_rows = all(isinstance(row, list) for row in rows)
+        return header, [_serialize_column(col, rows, list_rows) for col in columns]
+
+    def _build_page(self, view_rows: list[Any], start: int, limit: int) -> dict[str, Any]:
+        """Serialize one page of a view's rows."""
+        header, col_values = self._page_columns(view_rows, start, limit)
+
+        if not col_values:
+            return {"header": header, "rows": [[] for _ in view_rows[start:start + limit]]}
+
+        # Transpose the serialized columns into rows
+        return {
+            "header": header,
+            "rows": list(map(list, zip(*col_values)))
+        }
+
+    def sort_by_column(self, column_name: str, ascending: bool = True) -> bool:
         """
         Sort rows by the specified column.
 
-        Uses VisiData's column value getter to sort rows in place.
-        Stores the original row order on first sort for potential reset.
-
         Args:
             column_name: Name of the column to sort by
             ascending: True for ascending order, False for descending
 
+        Returns:
+            False if the rows were already in this order (nothing changed)
+
         Raises:
             ValueError: If column not found
         """
         with self._lock:
-            # Store original rows if this is the first sort/filter operation
-            if self._original_rows is None:
-                self._original_rows = self.sheet.rows[:]
-
             # Find the column
-            col = next((c for c in self.sheet.columns if c.name == column_name), None)
+            col = self._col_by_name.get(column_name)
             if col is None:
                 raise ValueError(f"Column '{column_name}' not found")
 
-            # Optimization: Fast path for list-based rows (CSV)
-            # Direct index access avoids VisiData's getter overhead
-            if hasattr(col, 'expr') and isinstance(col.expr, int) and self.sheet.rows and isinstance(self.sheet.rows[0], list):
-                idx = col.expr
-                
-                # Define key function optimized for direct access
-                # We use a tuple (type_group, value) to handle mixed types safely
-                # Group 0: Numbers (int, float)
-                # Group 1: Strings/Others
-                # Group 2: None (always last if ascending)
-                
-                # Pre-calculate constants to avoid closure lookup overhead
-                NONE_KEY = (2, None) if ascending else (0, None)
-                
-                def fast_key(row):
-                    try:
-                        val = row[idx]
-                        if val is None:
-                            return NONE_KEY
-                        
-                        if isinstance(val, (int, float)):
-                            return (0, val)
-                        
-                        # Fallback for strings or other types
-                        return (1, str(val))
-                    except IndexError:
-                        return NONE_KEY
-
-                # In-place sort is slightly faster than sorted()
-                self.sheet.rows.sort(key=fast_key, reverse=not ascending)
-
-            else:
-                # Slow path: use VisiData's column value getter
-                # Handle potential errors in getTypedValue by falling back to string comparison
-                def sort_key(row: Any) -> Any:
-                    try:
-                        val = col.getTypedValue(row)
-                        # Handle None values (sort them to the end)
-                        if val is None:
-                            return (2, None) if ascending else (0, None)
-                        
-                        # Check if value matches column type (e.g. float)
-                        # If column type is float but val is string (conversion failed),
-                        # we treat it as a different group to avoid comparison errors.
-                        if isinstance(val, (int, float)):
-                            return (0, val)
-                        else:
-                            # Failed conversion or other type
-                            return (1, str(val))
-                    except Exception:
-                        # Fallback to display value for comparison
-                        return (1, col.getDisplayValue(row))
-
-                self.sheet.rows.sort(
-                    key=sort_key,
-                    reverse=not ascending
-                )
+            # Repeating the current sort on rows it produced is a no-op
+            if self._current_sort == (column_name, ascending) and self.sheet.rows is self._sort_result:
+                return False
+
+            # Sort into a new list: the current one may be held by readers
+            self.sheet.rows = self._sort_result = _sorted_rows(self.sheet.rows, col, ascending)
 
             # Track current sort state
             self._current_sort = (column_name, ascending)
             # Invalidate stats cache as order/sample might change (though distribution of full col doesn't, sample might)
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
+            return True
 
     def filter_by_column(self, column_name: str, search_term: str) -> None:
         """
@@ -215,34 +352,26 @@ class DatasetHandle:
             ValueError: If column not found
         """
         with self._lock:
-            # Store original rows if this is the first operation
-            if self._original_rows is None:
-                self._original_rows = self.sheet.rows[:]
-
             # Find the column
-            col = next((c for c in self.sheet.columns if c.name == column_name), None)
+            col = self._col_by_name.get(column_name)
             if col is None:
                 raise ValueError(f"Column '{column_name}' not found")
 
             # Start from original rows (to allow cumulative filtering)
             source_rows = self._original_rows
 
-            # Filter rows (case-insensitive substring search)
+            # Filter rows (case-insensitive substring search);
+            # rows that could not be read are skipped
             search_lower = search_term.lower()
-            filtered = []
-            for row in source_rows:
-                try:
-                    value = str(col.getValue(row))
-                    if search_lower in value.lower():
-                        filtered.append(row)
-                except Exception:
-                    # Skip rows that cause errors
-                    continue
-
-            self.sheet.rows = filtered
+            self.sheet.rows = [
+                row
+                for row, value in zip(source_rows, self._lowered_values(col))
+                if value is not None and search_lower in value
+            ]
             self._current_filter = (column_name, search_term)
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
 
     def apply_structured_filter(self, filter_payload: dict[str, Any] | None) -> None:
         """
@@ -264,18 +393,14 @@ class DatasetHandle:
             if not column_name or not operator:
                 return
 
-            # Store original rows if this is the first operation
-            if self._original_rows is None:
-                self._original_rows = self.sheet.rows[:]
-
             # Reset to original rows before applying new filter
-            self.sheet.rows = self._original_rows[:]
+            self.sheet.rows = self._original_rows
             
             # Clear any existing selection
             if hasattr(self.sheet, 'selected'):
                 self.sheet.selected = []
 
-            col = next((c for c in self.sheet.columns if c.name == column_name), None)
+            col = self._col_by_name.get(column_name)
             if col is None:
                 raise ValueError(f"Column '{column_name}' not found")
 
@@ -343,6 +468,7 @@ class DatasetHandle:
             self._current_filter = (column_name, f"{operator} {value}")
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
 
     def clear_filter(self) -> None:
         """
@@ -351,45 +477,30 @@ class DatasetHandle:
         Preserves current sort order if sorting was applied.
         """
         with self._lock:
-            if self._original_rows is not None:
-                self.sheet.rows = self._original_rows[:]
-                self._current_filter = None
-
-                # Reapply sort if there was one
-                if self._current_sort is not None:
-                    column_name, ascending = self._current_sort
-                    # Re-sort without storing original rows again
-                    col = next((c for c in self.sheet.columns if c.name == column_name), None)
-                    if col:
-                        def sort_key(row: Any) -> Any:
-                            try:
-                                val = col.getTypedValue(row)
-                                if val is None:
-                                    return (1, None) if ascending else (0, None)
-                                return (0, val)
-                            except Exception:
-                                return (0, col.getDisplayValue(row))
-
-                        self.sheet.rows = sorted(
-                            self.sheet.rows,
-                            key=sort_key,
-                            reverse=not ascending
-                        )
+            self.sheet.rows = self._original_rows
+            self._current_filter = None
+
+            # Reapply sort if there was one
+            if self._current_sort is not None:
+                column_name, ascending = self._current_sort
+                col = self._col_by_name.get(column_name)
+                if col:
+                    self.sheet.rows = self._sort_result = _sorted_rows(self.sheet.rows, col, ascending)
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
 
     def reset(self) -> None:
         """
         Reset to original state (clear all sorts and filters).
         """
         with self._lock:
-            if self._original_rows is not None:
-                self.sheet.rows = self._original_rows[:]
-                self._original_rows = None
+            self.sheet.rows = self._original_rows
             self._current_sort = None
             self._current_filter = None
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
 
     def set_column_type(self, col_name: str, new_type_str: str) -> None:
         """
@@ -407,7 +518,7 @@ class DatasetHandle:
         """
         with self._lock:
             # Find the column
-            col = next((c for c in self.sheet.columns if c.name == col_name), None)
+            col = self._col_by_name.get(col_name)
             if col is None:
                 raise ValueError(f"Column '{col_name}' not found")
             
@@ -429,14 +540,20 @@ class DatasetHandle:
             
             # Set the column type
             col.type = new_type
+            self._column_info = None
+            self._columns_payload = None
+            self._columns_json = None
             
             # CRITICAL: Convert the underlying data to match the new type
             # This ensures that getTypedValue returns the correct type
             _convert_column_data(col, self.sheet.rows)
+            self._sort_result = None  # Typed values, and so the sort order, may change
+            self._lowered.pop(col_name, None)
             
             # Clear caches to force recomputation with new type
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
 
     def rename_column(self, old_name: str, new_name: str) -> None:
         """
@@ -460,20 +577,24 @@ class DatasetHandle:
             new_name = new_name.strip()
             
             # Check if new name already exists (case-sensitive)
-            if any(c.name == new_name for c in self.sheet.columns):
+            if new_name in self._col_by_name:
                 raise ValueError(f"Column '{new_name}' already exists")
             
             # Find the column by old name
-            col = next((c for c in self.sheet.columns if c.name == old_name), None)
+            col = self._col_by_name.get(old_name)
             if col is None:
                 raise ValueError(f"Column '{old_name}' not found")
             
             # Update the column name
             col.name = new_name
+            self._index_columns()
+            if old_name in self._lowered:
+                self._lowered[new_name] = self._lowered.pop(old_name)
             
             # Clear caches to force refresh
             self._stats_cache.clear()
             self._sample_rows = None
+            self._publish()
 
     def get_state(self) -> dict[str, Any]:
         """
@@ -482,17 +603,21 @@ class DatasetHandle:
         Returns:
             Dictionary with 'sort' and 'filter' state
         """
-        with self._lock:
-            return {
-                "sort": {
-                    "column": self._current_sort[0] if self._current_sort else None,
-                    "ascending": self._current_sort[1] if self._current_sort else None,
-                } if self._current_sort else None,
-                "filter": {
-                    "column": self._current_filter[0] if self._current_filter else None,
-                    "term": self._current_filter[1] if self._current_filter else None,
-                } if self._current_filter else None,
-            }
+        return _view_state(self._view)
+
+    def get_state_json(self) -> bytes:
+        """
+        Return get_state() encoded as JSON.
+
+        Cached on the current view, so it is rebuilt only after a sort,
+        filter or reset replaces the view.
+        """
+        view = self._view
+        state_json = view.cached_page(("state",))
+        if state_json is None:
+            state_json = encode_json(_view_state(view))
+            view.cache_page(("state",), state_json)
+        return state_json
 
     def get_column_frequency(self, col_name: str, limit: int = 20) -> list[dict[str, Any]]:
         """
@@ -501,57 +626,31 @@ class DatasetHandle:
         """
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"Starting frequency analysis for column: {col_name}")
+        logger.info("Starting frequency analysis for column: %s", col_name)
 
         with self._lock:
-            col = next((c for c in self.sheet.columns if c.name == col_name), None)
+            col = self._col_by_name.get(col_name)
             if col is None:
                 raise ValueError(f"Column '{col_name}' not found")
 
-            # Use Counter to count values
+            # Count raw values with Counter's C loop, then normalize the
+            # (much smaller) set of distinct values; unreadable cells are skipped
+            values = _column_cells(col, self.sheet.rows)
+            try:
+                raw_counts = collections.Counter(values)
+            except TypeError:
+                # Unhashable cells: normalize before counting
+                raw_counts = collections.Counter(
+                    _frequency_key(val) if val is not _MISSING else val for val in values
+                )
+            raw_counts.pop(_MISSING, None)
+
             counter = collections.Counter()
-            
-            # Optimization: Fast path for list-based rows
-            if hasattr(col, 'expr') and isinstance(col.expr, int) and self.sheet.rows and isinstance(self.sheet.rows[0], list):
-                logger.info("Using fast path for frequency analysis")
-                idx = col.expr
-                for row in self.sheet.rows:
-                    try:
-                        val = row[idx]
-                        # Handle None/NaN
-                        if val is None:
-                            val = "(empty)"
-                        elif isinstance(val, float) and math.isnan(val):
-                            val = "(empty)"
-                        
-                        # Ensure value is hashable
-                        if not isinstance(val, (str, int, float, bool, bytes)):
-                            val = str(val)
-                            
-                        counter[val] += 1
-                    except (IndexError, TypeError):
-                        pass
-            else:
-                logger.info("Using slow path for frequency analysis")
-                # Slow path
-                for row in self.sheet.rows:
-                    try:
-                        val = col.getValue(row)
-                        if val is None:
-                            val = "(empty)"
-                        elif isinstance(val, float) and math.isnan(val):
-                            val = "(empty)"
-                            
-                        # Ensure value is hashable
-                        if not isinstance(val, (str, int, float, bool, bytes)):
-                            val = str(val)
-                            
-                        counter[val] += 1
-                    except Exception:
-                        pass
+            for val, count in raw_counts.items():
+                counter[_frequency_key(val)] += count
 
             total_count = sum(counter.values())
-            logger.info(f"Analysis complete. Total count: {total_count}")
+            logger.info("Analysis complete. Total count: %s", total_count)
             
             if total_count == 0:
                 return []
@@ -594,7 +693,7 @@ class DatasetHandle:
             if col_name in self._stats_cache:
                 return self._stats_cache[col_name]
 
-            col = next((c for c in self.sheet.columns if c.name == col_name), None)
+            col = self._col_by_name.get(col_name)
             if col is None:
                 raise ValueError(f"Column '{col_name}' not found")
 
@@ -608,37 +707,17 @@ class DatasetHandle:
             unique_set = set()
             numeric_values = []
             
-            # Optimization: Fast path for list-based rows
-            if hasattr(col, 'expr') and isinstance(col.expr, int) and self.sheet.rows and isinstance(self.sheet.rows[0], list):
-                idx = col.expr
-                for row in rows_to_scan:
-                    try:
-                        val = row[idx]
-                        if val is None or val == "":
-                            null_count += 1
-                        else:
-                            # Use set for uniqueness (no truncation to preserve accuracy)
-                            # We convert to string to ensure hashability for mixed types
-                            unique_set.add(str(val))
-                            
-                            if isinstance(val, (int, float)) and not (isinstance(val, float) and math.isnan(val)):
-                                numeric_values.append(val)
-                    except IndexError:
-                        null_count += 1
-            else:
-                # Slow path
-                for row in rows_to_scan:
-                    try:
-                        val = col.getValue(row)
-                        if val is None or val == "":
-                            null_count += 1
-                        else:
-                            unique_set.add(str(val))
-                            
-                            if isinstance(val, (int, float)) and not (isinstance(val, float) and math.isnan(val)):
-                                numeric_values.append(val)
-                    except Exception:
-                        null_count += 1
+            # Unreadable cells count as nulls
+            for val in _column_cells(col, rows_to_scan):
+                if val is _MISSING or val is None or val == "":
+                    null_count += 1
+                else:
+                    # Use set for uniqueness (no truncation to preserve accuracy)
+                    # We convert to string to ensure hashability for mixed types
+                    unique_set.add(str(val))
+
+                    if isinstance(val, (int, float)) and not (isinstance(val, float) and math.isnan(val)):
+                        numeric_values.append(val)
 
             # Calculate stats
             unique_count = len(unique_set)
@@ -666,23 +745,142 @@ class DatasetHandle:
             return stats
 
 
+def _view_state(view: _View) -> dict[str, Any]:
+    """Sort and filter state of a view, as returned by get_state()."""
+    return {
+        "sort": {
+            "column": view.sort[0],
+            "ascending": view.sort[1],
+        } if view.sort else None,
+        "filter": {
+            "column": view.filter[0],
+            "term": view.filter[1],
+        } if view.filter else None,
+    }
+
+
+def _column_cells(col: Any, rows: list[Any]) -> list[Any]:
+    """
+    Materialize one column of the given rows as a list of raw values.
+
+    List-based rows (CSV) are read with a single comprehension; other
+    rows go through the column's getter. Cells that cannot be read
+    (short rows, getter errors) come back as _MISSING.
+    """
+    expr = getattr(col, 'expr', None)
+    if isinstance(expr, int) and rows and isinstance(rows[0], list):
+        try:
+            return [row[expr] for row in rows]
+        except IndexError:
+            return [row[expr] if expr < len(row) else _MISSING for row in rows]
+
+    values = []
+    for row in rows:
+        try:
+            values.append(col.getValue(row))
+        except Exception:
+            values.append(_MISSING)
+    return values
+
+
+def _frequency_key(val: Any) -> Any:
+    """Normalize a cell value into a hashable frequency bucket."""
+    # Handle None/NaN
+    if val is None:
+        return "(empty)"
+    if isinstance(val, float) and math.isnan(val):
+        return "(empty)"
+
+    # Ensure value is hashable
+    if not isinstance(val, (str, int, float, bool, bytes)):
+        return str(val)
+    return val
+
+
+def _sorted_rows(rows: list[Any], col: Any, ascending: bool) -> list[Any]:
+    """
+    Return the rows ordered by a column, as a new list.
+
+    Sort keys are computed once into a list and row positions are sorted
+    with that list's __getitem__ as the key function - an argsort with
+    no Python-level callback per row. Numbers sort before everything
+    else, which is compared as text; rows without a value are kept out
+    of the sort and always placed last.
+    """
+    expr = getattr(col, 'expr', None)
+    if isinstance(expr, int) and rows and isinstance(rows[0], list):
+        # Fast path for list-based rows (CSV): sort on the raw cells
+        try:
+            values = [row[expr] for row in rows]
+        except IndexError:
+            values = [row[expr] if expr < len(row) else None for row in rows]
+    else:
+        # Slow path: use VisiData's typed value getter
+        values = [_typed_sort_value(col, row) for row in rows]
+
+    kinds = set(map(type, values))
+    has_nulls = type(None) in kinds
+    kinds.discard(type(None))
+    if kinds <= {int, float, bool} or kinds == {str}:
+        # Homogeneous column: the values are their own sort keys
+        if has_nulls:
+            positions = [p for p, val in enumerate(values) if val is not None]
+        else:
+            positions = list(range(len(values)))
+        positions.sort(key=values.__getitem__, reverse=not ascending)
+    else:
+        # Mixed column: sort numbers and text as separate groups rather
+        # than building a (group, value) tuple for every row
+        numbers = [p for p, val in enumerate(values) if isinstance(val, (int, float))]
+        numbers.sort(key=values.__getitem__, reverse=not ascending)
+        others = [
+            p for p, val in enumerate(values)
+            if val is not None and not isinstance(val, (int, float))
+        ]
+        text = [str(values[p]) for p in others]
+        order = sorted(range(len(others)), key=text.__getitem__, reverse=not ascending)
+        others = list(map(others.__getitem__, order))
+        positions = numbers + others if ascending else others + numbers
+    if has_nulls:
+        positions.extend(p for p, val in enumerate(values) if val is None)
+    return list(map(rows.__getitem__, positions))
+
+
+def _typed_sort_value(col: Any, row: Any) -> Any:
+    """
+    Sort value for a row based on the column's typed value.
+
+    Numbers are returned as-is; values that failed type conversion are
+    compared as strings. Returns None for missing values.
+    """
+    try:
+        val = col.getTypedValue(row)
+        if val is None:
+            return None
+        if isinstance(val, (int, float)):
+            return val
+        # Failed conversion or other type
+        return str(val)
+    except Exception:
+        # Fallback to display value for comparison
+        return col.getDisplayValue(row)
+
+
+@functools.lru_cache(maxsize=None)
 def _get_type_name(vd_type: Any) -> str:
-    """Map VisiData type objects to string names."""
+    """
+    Map VisiData type objects to string names.
+
+    VisiData types are long-lived singletons, so each one is resolved once.
+    """
     if vd_type is None:
         return "string"  # Default to string for untyped columns
 
-    type_map = {
-        int: "integer",
-        float: "float",
-        str: "string",
-        bool: "boolean",
-    }
-
     # Handle VisiData's special types
     type_name = getattr(vd_type, '__name__', str(vd_type))
 
-    if vd_type in type_map:
-        return type_map[vd_type]
+    if vd_type in _TYPE_NAMES:
+        return _TYPE_NAMES[vd_type]
     elif type_name == 'anytype' or type_name == '':
         return "string"
     elif 'date' in type_name.lower():
@@ -693,32 +891,108 @@ def _get_type_name(vd_type: Any) -> str:
         return type_name if type_name else "string"
 
 
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode a JSON-safe object (e.g. an API payload) with orjson.
+
+    orjson rejects integers beyond 64 bits, which typed columns can hold;
+    such payloads fall back to the stdlib encoder.
+    """
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _serialize_column(col: Any, rows: list[Any], list_rows: bool) -> list[Any]:
+    """
+    Serialize one column's values for a page of rows.
+
+    The reader is picked once per column: list rows are read by index,
+    untyped (anytype) columns through getValue, since getTypedValue would
+    return the same value, and int/float/str columns by converting the
+    raw values directly. A column whose cells are all JSON-safe
+    primitives is then returned without per-value conversion.
+    """
+    expr = getattr(col, 'expr', None)
+    idx = expr if list_rows and isinstance(expr, int) else None
+    values = None
+    try:
+        if idx is not None:
+            values = [row[idx] for row in rows]
+        elif col.type is visidata.anytype:
+            values = list(map(col.getValue, rows))
+        elif col.type in (int, float, str):
+            values = _convert_plain_values(col, rows)
+    except Exception:
+        values = None  # Ragged rows or getter/conversion errors: fall back to the per-cell path
+    if values is not None:
+        kinds = set(map(type, values)) - _JSON_SAFE_TYPES
+        if not kinds:
+            return values
+        if kinds == {float}:
+            # Only NaN/Infinity need converting
+            isfinite = math.isfinite
+            return [
+                v if type(v) is not float or isfinite(v) else _serialize_value(v)
+                for v in values
+            ]
+        try:
+            return list(map(_serialize_value, values))
+        except Exception:
+            pass
+
+    values = []
+    for row in rows:
+        try:
+            value = row[idx] if idx is not None else col.getTypedValue(row)
+            values.append(_serialize_value(value))
+        except Exception:
+            values.append(col.getDisplayValue(row))
+    return values
+
+
+def _convert_plain_values(col: Any, rows: list[Any]) -> list[Any] | None:
+    """
+    Typed values of an int/float/str column, without getTypedValue.
+
+    Converts the raw values with the column type, as getTypedValue does
+    but without its per-cell wrapper. Returns None when a raw value is
+    not a plain scalar (the wrapper's handling would differ); conversion
+    errors propagate to the caller.
+    """
+    values = list(map(col.getValue, rows))
+    if set(map(type, values)) - _JSON_SAFE_TYPES - {float}:
+        return None
+    convert = col.type
+    return [None if v is None else convert(v) for v in values]
+
+
 def _serialize_value(value: Any) -> Any:
     """
     Convert a value to a JSON-serializable type.
 
-    Handles common non-serializable types from VisiData.
+    Handles common non-serializable types from VisiData. Exact builtin
+    types are dispatched with one lookup on type(value); subclasses and
+    other objects go through the isinstance checks below.
     """
-    if value is None:
-        return None
+    kind = type(value)
+    if kind in _JSON_SAFE_TYPES:
+        return value
+    serialize = _SERIALIZERS.get(kind)
+    if serialize is not None:
+        return serialize(value)
 
     # Already serializable primitives
     if isinstance(value, (str, int, bool)):
         return value
 
     if isinstance(value, float):
-        if math.isnan(value):
-            return "NaN"
-        if math.isinf(value):
-            return "Infinity" if value > 0 else "-Infinity"
-        return value
+        return _serialize_float(value)
 
     # Handle bytes
     if isinstance(value, bytes):
-        try:
-            return value.decode('utf-8')
-        except UnicodeDecodeError:
-            return value.hex()
+        return _serialize_bytes(value)
 
     # Handle datetime objects
     if hasattr(value, 'isoformat'):
@@ -732,7 +1006,31 @@ def _serialize_value(value: Any) -> Any:
     return str(value)
 
 
-def load_dataset(path: str) -> DatasetHandle:
+def _serialize_float(value: float) -> float | str:
+    """Spell out NaN and infinities, which JSON cannot represent."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+
+def _serialize_bytes(value: bytes) -> str:
+    """Decode bytes as UTF-8, falling back to hex."""
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return value.hex()
+
+
+# Serializers for exact builtin types that are not already JSON-safe
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    float: _serialize_float,
+    bytes: _serialize_bytes,
+}
+
+
+def load_dataset(path: str, progress: Callable[[int], None] | None = None) -> DatasetHandle:
     """
     Load a dataset from the given path using VisiData's loaders.
 
@@ -745,6 +1043,8 @@ def load_dataset(path: str) -> DatasetHandle:
 
     Args:
         path: Path to the data file (local filesystem)
+        progress: Optional callback, called with the number of rows read
+            so far every _LOAD_PROGRESS_ROWS rows (from the loading thread)
 
     Returns:
         DatasetHandle for accessing the loaded data
@@ -768,7 +1068,15 @@ def load_dataset(path: str) -> DatasetHandle:
     # VisiData's reload() is async by default. For synchronous loading,
     # we directly call iterload() and materialize the rows.
     if hasattr(sheet, 'iterload'):
-        sheet.rows = list(sheet.iterload())
+        if progress is None:
+            sheet.rows = list(sheet.iterload())
+        else:
+            rows = []
+            for row in sheet.iterload():
+                rows.append(row)
+                if len(rows) % _LOAD_PROGRESS_ROWS == 0:
+                    progress(len(rows))
+            sheet.rows = rows
 
     # Handle CSV/TSV: first row is header, create columns from it
     # VisiData's CsvSheet yields raw lists where row[0] is the header
@@ -4,15 +4,19 @@ import asyncio
 import json
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Literal
 
-from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from backend.core import (
     DatasetHandle,
+    encode_json,
     get_current_dataset,
     load_dataset,
     set_current_dataset,
@@ -21,6 +25,9 @@ from backend.core import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Most cells serialized into one page of rows, whatever the limit asked for
+MAX_CELLS = 500_000
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -50,10 +57,10 @@ app = FastAPI(
 # CORS middleware for local development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Restrict in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=["http://localhost:5173", "http://127.0.0.1:5173"],  # Vite dev server
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 
@@ -73,11 +80,14 @@ class ColumnsResponse(BaseModel):
 
 
 class RowsResponse(BaseModel):
-    """Response for /rows endpoint."""
-    rows: list[dict[str, Any]]
+    """Response for /rows endpoint (format=columnar sends 'columns' instead of 'rows')."""
+    header: list[str]
+    rows: list[list[Any]] | None = None
+    columns: list[list[Any]] | None = None
     start: int
     limit: int
     total: int
+    truncated: bool = False
 
 
 class DatasetInfoResponse(BaseModel):
@@ -118,8 +128,27 @@ def _get_dataset_or_none() -> DatasetHandle | None:
     return get_current_dataset()
 
 
+def _clamp_to_cell_budget(dataset: DatasetHandle, limit: int) -> tuple[int, bool]:
+    """Cap a row limit so one page holds at most MAX_CELLS cells; also report whether it was cut."""
+    effective_limit = min(limit, max(1, MAX_CELLS // max(1, dataset.column_count)))
+    return effective_limit, effective_limit < limit
+
+
 # --- WebSocket Handler ---
 
+@dataclass(frozen=True)
+class Cmd:
+    """A WebSocket command: its handler and the parameters it requires."""
+    fn: Callable[[WebSocketHandler, dict], Awaitable[None]]
+    required: tuple[str, ...] = ()
+    err_action: str = "error"
+
+    @property
+    def missing_error(self) -> str:
+        names = " or ".join(f"'{key}'" for key in self.required)
+        return f"Missing {names} parameter"
+
+
 class WebSocketHandler:
     """
     Handles WebSocket commands for real-time data exploration.
@@ -132,8 +161,23 @@ class WebSocketHandler:
     def __init__(self, websocket: WebSocket):
         self.websocket = websocket
 
+    async def send_data(self, action: str, data_json: str):
+        """
+        Send a successful response whose data is already encoded as JSON.
+
+        The envelope is constant-shape, so it is written around data_json
+        directly. Frames stay text: the frontend parses every message with
+        JSON.parse(event.data).
+        """
+        await self.websocket.send_text(
+            f'{{"action":"{action}","success":true,"data":{data_json}}}'
+        )
+
     async def send_response(self, action: str, data: Any = None, success: bool = True, error: str | None = None):
         """Send a JSON response to the client."""
+        if success and data is not None and error is None:
+            await self.send_data(action, encode_json(data).decode())
+            return
         response = {
             "action": action,
             "success": success,
@@ -142,12 +186,56 @@ class WebSocketHandler:
             response["data"] = data
         if error is not None:
             response["error"] = error
-        await self.websocket.send_json(response)
+        await self.websocket.send_text(encode_json(response).decode())
 
     async def send_error(self, message: str, action: str = "error"):
         """Send an error response."""
         await self.send_response(action, success=False, error=message)
 
+    async def send_rows(
+        self,
+        dataset: DatasetHandle,
+        start: int,
+        limit: int,
+        reset: bool = False,
+        columnar: bool = False,
+        truncated: bool = False,
+    ):
+        """
+        Send a page of rows, splicing in the dataset's cached page JSON.
+
+        reset=True signals the frontend to clear its row cache.
+        columnar=True sends {header, columns} instead of {header, rows}.
+        truncated=True tells the client its requested limit was cut.
+        """
+        page_json = await asyncio.to_thread(dataset.get_rows_json, start, limit, columnar)
+        extra = ',"reset":true' if reset else ''
+        if columnar:
+            extra += ',"format":"columnar"'
+        if truncated:
+            extra += ',"truncated":true'
+        await self.send_data(
+            "rows",
+            f'{{"rows":{page_json.decode()},'
+            f'"start":{start},"limit":{limit},"total":{dataset.row_count}{extra}}}',
+        )
+
+    async def send_columns(self, dataset: DatasetHandle):
+        """Send the column list, splicing in the dataset's cached column JSON."""
+        await self.send_data(
+            "columns",
+            f'{{"columns":{dataset.get_columns_json()},"count":{dataset.column_count}}}',
+        )
+
+    async def send_state(self, action: str, dataset: DatasetHandle, unchanged: bool = False):
+        """Send the view state after a mutation, splicing in the cached state JSON."""
+        extra = ',"unchanged":true' if unchanged else ""
+        await self.send_data(
+            action,
+            f'{{"success":true,'
+            f'"state":{dataset.get_state_json().decode()},"total":{dataset.row_count}{extra}}}',
+        )
+
     async def handle_get_columns(self):
         """Handle get_columns command."""
         dataset = _get_dataset_or_none()
@@ -155,16 +243,9 @@ class WebSocketHandler:
             await self.send_error("No dataset loaded", action="columns")
             return
 
-        columns = [
-            {"name": c.name, "type": c.type, "width": c.width}
-            for c in dataset.get_columns()
-        ]
-        await self.send_response("columns", {
-            "columns": columns,
-            "count": len(columns)
-        })
+        await self.send_columns(dataset)
 
-    async def handle_get_rows(self, start: int = 0, limit: int = 50):
+    async def handle_get_rows(self, start: int = 0, limit: int = 50, columnar: bool = False):
         """Handle get_rows command."""
         dataset = _get_dataset_or_none()
         if dataset is None:
@@ -174,14 +255,9 @@ class WebSocketHandler:
         # Clamp values
         start = max(0, start)
         limit = min(max(1, limit), 10000)
+        limit, truncated = _clamp_to_cell_budget(dataset, limit)
 
-        rows = dataset.get_rows(start=start, limit=limit)
-        await self.send_response("rows", {
-            "rows": rows,
-            "start": start,
-            "limit": limit,
-            "total": dataset.row_count
-        })
+        await self.send_rows(dataset, start, limit, columnar=columnar, truncated=truncated)
 
     async def handle_get_info(self):
         """Handle get_info command."""
@@ -190,27 +266,36 @@ class WebSocketHandler:
             await self.send_error("No dataset loaded", action="info")
             return
 
-        columns = [
-            {"name": c.name, "type": c.type, "width": c.width}
-            for c in dataset.get_columns()
-        ]
-        await self.send_response("info", {
-            "path": dataset.path,
-            "row_count": dataset.row_count,
-            "column_count": dataset.column_count,
-            "columns": columns
-        })
+        # Splice in the cached column metadata; only the counts vary per call
+        await self.send_data(
+            "info",
+            f'{{"path":{json.dumps(dataset.path, ensure_ascii=False)},'
+            f'"row_count":{dataset.row_count},"column_count":{dataset.column_count},'
+            f'"columns":{dataset.get_columns_json()}}}',
+        )
 
     async def handle_load(self, path: str):
-        """Handle load command to load a new dataset."""
+        """
+        Handle load command to load a new dataset.
+
+        Sends load_progress messages with the rows read so far while the
+        file is parsed in a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        pending = []
+
+        def progress(rows_read: int) -> None:
+            pending.append(asyncio.run_coroutine_threadsafe(
+                self.send_response("load_progress", {"rows": rows_read}), loop
+            ))
+
         try:
-            dataset = load_dataset(path)
+            dataset = await asyncio.to_thread(load_dataset, path, progress)
+            # Let queued progress messages go out before "loaded"
+            await asyncio.gather(*map(asyncio.wrap_future, pending))
             set_current_dataset(dataset)
 
-            columns = [
-                {"name": c.name, "type": c.type, "width": c.width}
-                for c in dataset.get_columns()
-            ]
+            columns = dataset.get_columns_payload()
             await self.send_response("loaded", {
                 "path": dataset.path,
                 "row_count": dataset.row_count,
@@ -231,25 +316,18 @@ class WebSocketHandler:
 
         try:
             # Apply sort
-            dataset.sort_by_column(column, ascending)
+            changed = await asyncio.to_thread(dataset.sort_by_column, column, ascending)
 
             # Return updated state and rows
-            state = dataset.get_state()
-            await self.send_response("sorted", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
+            if not changed:
+                # Same sort again (e.g. a double click): the client's rows are current
+                await self.send_state("sorted", dataset, unchanged=True)
+                return
+
+            await self.send_state("sorted", dataset)
 
             # Also send the first chunk of sorted rows
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "rows": rows,
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True  # Signal frontend to clear cache
-            })
+            await self.send_rows(dataset, 0, 100, reset=True)
 
         except ValueError as e:
             await self.send_error(str(e), action="sorted")
@@ -266,27 +344,15 @@ class WebSocketHandler:
         try:
             # Apply filter
             if term.strip():  # Only filter if term is non-empty
-                dataset.filter_by_column(column, term)
+                await asyncio.to_thread(dataset.filter_by_column, column, term)
             else:
-                dataset.clear_filter()
+                await asyncio.to_thread(dataset.clear_filter)
 
             # Return updated state and rows
-            state = dataset.get_state()
-            await self.send_response("filtered", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
+            await self.send_state("filtered", dataset)
 
             # Send the filtered rows
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "rows": rows,
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True  # Signal frontend to clear cache
-            })
+            await self.send_rows(dataset, 0, 100, reset=True)
 
         except ValueError as e:
             await self.send_error(str(e), action="filtered")
@@ -302,25 +368,13 @@ class WebSocketHandler:
 
         try:
             # Apply filter
-            dataset.apply_structured_filter(filter_payload)
+            await asyncio.to_thread(dataset.apply_structured_filter, filter_payload)
 
             # Return updated state and rows
-            state = dataset.get_state()
-            await self.send_response("filtered", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
+            await self.send_state("filtered", dataset)
 
             # Send the filtered rows
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "rows": rows,
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_rows(dataset, 0, 100, reset=True)
 
         except ValueError as e:
             await self.send_error(str(e), action="filtered")
@@ -335,25 +389,13 @@ class WebSocketHandler:
             return
 
         try:
-            dataset.reset()
+            await asyncio.to_thread(dataset.reset)
 
             # Return updated state
-            state = dataset.get_state()
-            await self.send_response("reset", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
+            await self.send_state("reset", dataset)
 
             # Send rows from original state
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "rows": rows,
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True  # Signal frontend to clear cache
-            })
+            await self.send_rows(dataset, 0, 100, reset=True)
 
         except Exception as e:
             await self.send_error(f"Reset failed: {e}", action="reset")
@@ -405,27 +447,13 @@ class WebSocketHandler:
 
         try:
             # Change the column type
-            dataset.set_column_type(col_id, type_str)
+            await asyncio.to_thread(dataset.set_column_type, col_id, type_str)
 
             # Send updated columns list
-            columns = [
-                {"name": c.name, "type": c.type, "width": c.width}
-                for c in dataset.get_columns()
-            ]
-            await self.send_response("columns", {
-                "columns": columns,
-                "count": len(columns)
-            })
+            await self.send_columns(dataset)
 
             # Send refreshed rows to show new typed values
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "rows": rows,
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True  # Signal frontend to clear cache
-            })
+            await self.send_rows(dataset, 0, 100, reset=True)
 
         except ValueError as e:
             await self.send_error(str(e), action="columns")
@@ -441,115 +469,90 @@ class WebSocketHandler:
 
         try:
             # Rename the column
-            dataset.rename_column(col_id, new_name)
+            await asyncio.to_thread(dataset.rename_column, col_id, new_name)
 
             # Send updated columns list
-            columns = [
-                {"name": c.name, "type": c.type, "width": c.width}
-                for c in dataset.get_columns()
-            ]
-            await self.send_response("columns", {
-                "columns": columns,
-                "count": len(columns)
-            })
+            await self.send_columns(dataset)
 
             # Send refreshed rows with new column names
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "rows": rows,
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True  # Signal frontend to clear cache
-            })
+            await self.send_rows(dataset, 0, 100, reset=True)
 
         except ValueError as e:
             await self.send_error(str(e), action="columns")
         except Exception as e:
             await self.send_error(f"Rename failed: {e}", action="columns")
 
+    # Dispatch table built once for the class. Each command lists the
+    # parameters it requires; handle_command checks them in one pass.
+    _DISPATCH: dict[str, Cmd] = {
+        "get_columns": Cmd(lambda self, msg: self.handle_get_columns()),
+        "get_rows": Cmd(
+            lambda self, msg: self.handle_get_rows(
+                msg.get("start", 0),
+                msg.get("limit", 50),
+                msg.get("format") == "columnar",
+            )
+        ),
+        "get_info": Cmd(lambda self, msg: self.handle_get_info()),
+        "load": Cmd(
+            lambda self, msg: self.handle_load(msg["path"]),
+            required=("path",),
+            err_action="loaded",
+        ),
+        "sort": Cmd(
+            lambda self, msg: self.handle_sort(
+                msg["column"],
+                msg.get("ascending", True),
+            ),
+            required=("column",),
+            err_action="sorted",
+        ),
+        "filter": Cmd(
+            lambda self, msg: self.handle_filter(
+                msg["column"],
+                msg.get("term", ""),
+            ),
+            required=("column",),
+            err_action="filtered",
+        ),
+        "apply_filter": Cmd(lambda self, msg: self.handle_apply_filter(msg.get("filter"))),
+        "reset": Cmd(lambda self, msg: self.handle_reset()),
+        "analyze": Cmd(
+            lambda self, msg: self.handle_analyze(msg["column"]),
+            required=("column",),
+            err_action="analysis_result",
+        ),
+        "get_stats": Cmd(
+            lambda self, msg: self.handle_get_stats(msg["column"]),
+            required=("column",),
+            err_action="stats_result",
+        ),
+        "ping": Cmd(lambda self, msg: self.send_response("pong")),
+        "set_col_type": Cmd(
+            lambda self, msg: self.handle_set_col_type(msg["col_id"], msg["type"]),
+            required=("col_id", "type"),
+            err_action="columns",
+        ),
+        "rename_col": Cmd(
+            lambda self, msg: self.handle_rename_col(msg["col_id"], msg["new_name"]),
+            required=("col_id", "new_name"),
+            err_action="columns",
+        ),
+    }
+
     async def handle_command(self, message: dict):
         """Route a command to the appropriate handler."""
         action = message.get("action")
 
-        # Use a simple dispatch table to keep branching manageable for
-        # linters and maintainability. Handlers return coroutines.
-        handlers = {
-            "get_columns": (
-                lambda msg: self.handle_get_columns()
-            ),
-            "get_rows": (
-                lambda msg: self.handle_get_rows(
-                    msg.get("start", 0),
-                    msg.get("limit", 50),
-                )
-            ),
-            "get_info": (
-                lambda msg: self.handle_get_info()
-            ),
-            "load": (
-                lambda msg: self.handle_load(msg.get("path"))
-                if msg.get("path")
-                else self.send_error("Missing 'path' parameter", action="loaded")
-            ),
-            "sort": (
-                lambda msg: self.handle_sort(
-                    msg.get("column"),
-                    msg.get("ascending", True),
-                )
-                if msg.get("column")
-                else self.send_error("Missing 'column' parameter", action="sorted")
-            ),
-            "filter": (
-                lambda msg: self.handle_filter(
-                    msg.get("column"),
-                    msg.get("term", ""),
-                )
-                if msg.get("column")
-                else self.send_error("Missing 'column' parameter", action="filtered")
-            ),
-            "apply_filter": (
-                lambda msg: self.handle_apply_filter(msg.get("filter"))
-            ),
-            "reset": (
-                lambda msg: self.handle_reset()
-            ),
-            "analyze": (
-                lambda msg: self.handle_analyze(msg.get("column"))
-                if msg.get("column")
-                else self.send_error("Missing 'column' parameter", action="analysis_result")
-            ),
-            "get_stats": (
-                lambda msg: self.handle_get_stats(msg.get("column"))
-                if msg.get("column")
-                else self.send_error("Missing 'column' parameter", action="stats_result")
-            ),
-            "ping": (
-                lambda msg: self.send_response("pong")
-            ),
-            "set_col_type": (
-                lambda msg: self.handle_set_col_type(
-                    msg.get("col_id"),
-                    msg.get("type")
-                )
-                if msg.get("col_id") and msg.get("type")
-                else self.send_error("Missing 'col_id' or 'type' parameter", action="columns")
-            ),
-            "rename_col": (
-                lambda msg: self.handle_rename_col(
-                    msg.get("col_id"),
-                    msg.get("new_name")
-                )
-                if msg.get("col_id") and msg.get("new_name")
-                else self.send_error("Missing 'col_id' or 'new_name' parameter", action="columns")
-            ),
-        }
-
-        handler = handlers.get(action)
-        if handler:
-            await handler(message)
-        else:
+        cmd = self._DISPATCH.get(action)
+        if cmd is None:
             await self.send_error(f"Unknown action: {action}")
+            return
+        for key in cmd.required:
+            if not message.get(key):
+                await self.send_error(cmd.missing_error, action=cmd.err_action)
+                return
+        await cmd.fn(self, message)
 
 
 @app.websocket("/ws")
@@ -560,20 +563,25 @@ async def websocket_endpoint(websocket: WebSocket):
     Commands:
     - {"action": "get_columns"} - Get column metadata
     - {"action": "get_rows", "start": 0, "limit": 50} - Get row slice
+      (add "format": "columnar" for one value list per column)
     - {"action": "get_info"} - Get dataset info
-    - {"action": "load", "path": "/path/to/file"} - Load dataset
+    - {"action": "load", "path": "/path/to/file"} - Load dataset (sends load_progress updates)
     - {"action": "ping"} - Connection health check
     """
     await websocket.accept()
     handler = WebSocketHandler(websocket)
-    logger.info("WebSocket client connected")
+    logger.debug("WebSocket client connected")
 
     try:
         while True:
-            # Receive JSON message
+            # Decode the raw frame with orjson; it accepts both the text
+            # frames the frontend sends and binary frames.
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000), frame.get("reason"))
             try:
-                message = await websocket.receive_json()
-            except json.JSONDecodeError:
+                message = orjson.loads(frame.get("bytes") or frame.get("text") or b"")
+            except orjson.JSONDecodeError:
                 await handler.send_error("Invalid JSON")
                 continue
 
@@ -581,9 +589,9 @@ async def websocket_endpoint(websocket: WebSocket):
             await handler.handle_command(message)
 
     except WebSocketDisconnect:
-        logger.info("WebSocket client disconnected")
+        logger.debug("WebSocket client disconnected")
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
 
 
 # --- REST Endpoints (kept for compatibility) ---
@@ -608,13 +616,10 @@ async def load_data(request: LoadRequest):
     SQLite, Excel, and more.
     """
     try:
-        dataset = load_dataset(request.path)
+        dataset = await asyncio.to_thread(load_dataset, request.path)
         set_current_dataset(dataset)
 
-        columns = [
-            ColumnResponse(name=c.name, type=c.type, width=c.width)
-            for c in dataset.get_columns()
-        ]
+        columns = [ColumnResponse(**c) for c in dataset.get_columns_payload()]
 
         return LoadResponse(
             success=True,
@@ -632,23 +637,20 @@ async def load_data(request: LoadRequest):
         raise HTTPException(status_code=500, detail=f"Failed to load: {e}")
 
 
-@app.get("/info", response_model=DatasetInfoResponse, tags=["Data"])
+@app.get("/info", response_class=Response, responses={200: {"model": DatasetInfoResponse}}, tags=["Data"])
 async def get_info():
     """Get metadata about the currently loaded dataset."""
     dataset = _require_dataset()
-    columns = [
-        ColumnResponse(name=c.name, type=c.type, width=c.width)
-        for c in dataset.get_columns()
-    ]
-    return DatasetInfoResponse(
-        path=dataset.path,
-        row_count=dataset.row_count,
-        column_count=dataset.column_count,
-        columns=columns
+    # Splice in the cached column metadata; only the counts vary per call
+    return Response(
+        f'{{"path":{json.dumps(dataset.path, ensure_ascii=False)},'
+        f'"row_count":{dataset.row_count},"column_count":{dataset.column_count},'
+        f'"columns":{dataset.get_columns_json()}}}',
+        media_type="application/json",
     )
 
 
-@app.get("/columns", response_model=ColumnsResponse, tags=["Data"])
+@app.get("/columns", response_class=Response, responses={200: {"model": ColumnsResponse}}, tags=["Data"])
 async def get_columns():
     """
     Get column headers and types from the loaded dataset.
@@ -657,33 +659,54 @@ async def get_columns():
     and display width.
     """
     dataset = _require_dataset()
-    columns = [
-        ColumnResponse(name=c.name, type=c.type, width=c.width)
-        for c in dataset.get_columns()
-    ]
-    return ColumnsResponse(columns=columns, count=len(columns))
+    return Response(
+        f'{{"columns":{dataset.get_columns_json()},"count":{dataset.column_count}}}',
+        media_type="application/json",
+    )
 
 
-@app.get("/rows", response_model=RowsResponse, tags=["Data"])
+@app.get("/rows", response_class=Response, responses={200: {"model": RowsResponse}}, tags=["Data"])
 async def get_rows(
     start: int = Query(default=0, ge=0, description="Starting row index"),
-    limit: int = Query(default=50, ge=1, le=10000, description="Number of rows to return")
+    limit: int = Query(default=50, ge=1, le=10000, description="Number of rows to return"),
+    format: Literal["rows", "columnar"] = Query(default="rows", description="'columnar' returns one value list per column"),
 ):
     """
     Get a slice of rows from the loaded dataset.
 
     Supports pagination via start/limit parameters.
-    All values are serialized to JSON-safe types.
+    All values are serialized to JSON-safe types, so the page is
+    encoded once and cached instead of going through a response model.
     """
     dataset = _require_dataset()
+    limit, truncated = _clamp_to_cell_budget(dataset, limit)
+
+    # Splice the cached, pre-encoded page into the response envelope
+    page_json = await asyncio.to_thread(dataset.get_rows_json, start, limit, format == "columnar")
+    return Response(
+        b'{"start":%d,"limit":%d,"total":%d,%s%s' % (
+            start, limit, dataset.row_count, b'"truncated":true,' if truncated else b'', page_json[1:]
+        ),
+        media_type="application/json",
+    )
 
-    rows = dataset.get_rows(start=start, limit=limit)
 
-    return RowsResponse(
-        rows=rows,
-        start=start,
-        limit=limit,
-        total=dataset.row_count
+@app.get("/rows/stream", response_class=StreamingResponse, tags=["Data"])
+async def stream_rows(
+    start: int = Query(default=0, ge=0, description="Starting row index"),
+    limit: int = Query(default=10000, ge=1, le=1_000_000, description="Number of rows to return")
+):
+    """
+    Stream a slice of rows as newline-delimited JSON.
+
+    The first line is {"header", "start", "limit", "total"}; each following
+    line is one row. Meant for large downloads: rows are serialized in
+    chunks while the response is being sent.
+    """
+    dataset = _require_dataset()
+    return StreamingResponse(
+        dataset.iter_rows_ndjson(start=start, limit=limit),
+        media_type="application/x-ndjson",
     )
 
 
@@ -698,4 +721,4 @@ if static_dir.exists():
 # For development: python -m uvicorn backend.main:app --reload
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    uvicorn.run(app, host="127.0.0.1", port=8000, access_log=False, log_level="warning")
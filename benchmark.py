@@ -1,5 +1,6 @@
-import time
+import gc
 import os
+from time import perf_counter_ns
 from backend.core import load_dataset # 假设这个路径是正确的
 
 # --- 配置参数 ---
@@ -16,30 +17,38 @@ def run_benchmark():
     print(f"Benchmarking VisiLens on {FILENAME} (Runs: {NUM_RUNS})...")
     
     # 1. Load Time (Initial cold run)
-    start_time = time.time()
+    start_time = perf_counter_ns()
     handle = load_dataset(FILENAME)
-    load_time_initial = time.time() - start_time
+    load_time_initial = (perf_counter_ns() - start_time) / 1e9
     print(f"\n--- Load Test ---")
     print(f"Initial Load Time: {load_time_initial:.4f} seconds")
     
     # 2. Sort Time (Multiple runs for average)
-    if COLUMN_TO_SORT not in [c.name for c in handle.sheet.columns]:
+    col_names = {c.name for c in handle.get_columns()}
+    if COLUMN_TO_SORT not in col_names:
         print(f"Error: Column '{COLUMN_TO_SORT}' not found in dataset.")
         return
 
     sort_times = []
     print(f"\n--- Sort Test (Column: {COLUMN_TO_SORT}) ---")
     
-    # Run the sort multiple times
-    for i in range(1, NUM_RUNS + 1):
-        # Note: We must reload or shuffle the sheet if VisiData caches the sorted state.
-        # Assuming sort_by_column recalculates fully each time.
-        start_time = time.time()
-        handle.sort_by_column(COLUMN_TO_SORT, ascending=(i % 2 == 0)) # Alternates direction
-        sort_time = time.time() - start_time
+    # Run the sort multiple times; run 0 is a warmup and is not recorded
+    for i in range(NUM_RUNS + 1):
+        # Alternating direction keeps each run a real sort (repeating the
+        # current sort is a no-op).
+        gc.collect()
+        gc.disable()
+        try:
+            start_time = perf_counter_ns()
+            handle.sort_by_column(COLUMN_TO_SORT, ascending=(i % 2 == 0))
+            sort_time = (perf_counter_ns() - start_time) / 1e9
+        finally:
+            gc.enable()
+        if i == 0:
+            print(f"Warmup: {sort_time:.4f}s")
+            continue
         sort_times.append(sort_time)
         print(f"Run {i}/{NUM_RUNS}: {sort_time:.4f}s")
-        time.sleep(0.1) # Small pause to help system stabilize
 
     # Final Report
     avg_sort_time = sum(sort_times) / NUM_RUNS
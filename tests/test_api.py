@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+
+
+CSV = """name,age,city
+Alice,30,Paris
+bob,25,Berlin
+Carol,,paris
+Dave,41,Rome
+eve,25,Berlin
+"""
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Not entered as a context manager, so the lifespan hook that
+    # auto-loads backend/test.csv never runs
+    return TestClient(app)
+
+
+@pytest.fixture
+def loaded(client, tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text(CSV)
+    response = client.post("/load", json={"path": str(path)})
+    assert response.status_code == 200
+    return client
+
+
+def test_health(client):
+    assert client.get("/").json()["status"] == "ok"
+
+
+def test_rows_formats_agree(loaded):
+    rows = loaded.get("/rows", params={"start": 1, "limit": 3}).json()
+    columnar = loaded.get("/rows", params={"start": 1, "limit": 3, "format": "columnar"}).json()
+    assert rows["total"] == columnar["total"] == 5
+    assert rows["header"] == columnar["header"] == ["name", "age", "city"]
+    assert [list(row) for row in zip(*columnar["columns"])] == rows["rows"]
+
+
+def test_stream_rows(loaded):
+    lines = loaded.get("/rows/stream", params={"start": 3}).text.splitlines()
+    assert json.loads(lines[0])["total"] == 5
+    assert [json.loads(line)[0] for line in lines[1:]] == ["Dave", "eve"]
+
+
+def test_ws_sort_then_repeat(loaded):
+    with loaded.websocket_connect("/ws") as ws:
+        ws.send_text(json.dumps({"action": "sort", "column": "age"}))
+        sorted_ = json.loads(ws.receive_text())
+        assert sorted_["data"]["state"]["sort"] == {"column": "age", "ascending": True}
+        rows = json.loads(ws.receive_text())
+        assert [row[0] for row in rows["data"]["rows"]["rows"]] == ["bob", "eve", "Alice", "Dave", "Carol"]
+
+        ws.send_text(json.dumps({"action": "sort", "column": "age"}))
+        assert json.loads(ws.receive_text())["data"]["unchanged"] is True
+
+
+def test_ws_reports_missing_params(client):
+    with client.websocket_connect("/ws") as ws:
+        ws.send_text(json.dumps({"action": "rename_col", "col_id": "age"}))
+        reply = json.loads(ws.receive_text())
+    assert reply == {
+        "action": "columns",
+        "success": False,
+        "error": "Missing 'col_id' or 'new_name' parameter",
+    }
@@ -0,0 +1,15 @@
+import socket
+
+from vdweb.cli import bind_port
+
+
+def test_bind_port_refuses_a_port_in_use():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+        assert bind_port("127.0.0.1", port) is None
+
+    sock = bind_port("127.0.0.1", 0)
+    assert sock is not None
+    sock.close()
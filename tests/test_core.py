@@ -0,0 +1,199 @@
+import json
+import threading
+
+from vdweb.core import load_dataset
+
+
+CSV = """name,age,city
+Alice,30,Paris
+bob,25,Berlin
+Carol,,paris
+Dave,41,Rome
+eve,25,Berlin
+"""
+
+
+def _load(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text(CSV)
+    return load_dataset(str(path))
+
+
+def _names(handle):
+    return [row[0] for row in handle.get_rows(0, 100)["rows"]]
+
+
+def test_filter_is_case_insensitive(tmp_path):
+    handle = _load(tmp_path)
+    handle.filter_by_column("city", "PAR")
+    assert _names(handle) == ["Alice", "Carol"]
+    handle.clear_filter()
+    assert handle.row_count == 5
+
+
+def test_filter_narrows_and_widens(tmp_path):
+    handle = _load(tmp_path)
+    handle.filter_by_column("city", "r")
+    assert _names(handle) == ["Alice", "bob", "Carol", "Dave", "eve"]
+    handle.filter_by_column("city", "Ri")
+    assert _names(handle) == ["Alice", "Carol"]
+    handle.filter_by_column("city", "r")
+    assert _names(handle) == ["Alice", "bob", "Carol", "Dave", "eve"]
+    handle.filter_by_column("city", "ri")
+    assert _names(handle) == ["Alice", "Carol"]
+    handle.filter_by_column("city", "e")
+    assert _names(handle) == ["bob", "Dave", "eve"]
+
+
+def test_column_frequency(tmp_path):
+    handle = _load(tmp_path)
+    freq = handle.get_column_frequency("city")
+    assert freq[0] == {"name": "Berlin", "count": 2, "percent": 40.0}
+    assert {item["name"] for item in freq} == {"Berlin", "Paris", "paris", "Rome"}
+
+
+def test_cached_lookups_never_scan(tmp_path):
+    handle = _load(tmp_path)
+    assert handle.cached_column_frequency("city") is None
+    assert handle.cached_column_stats("age") is None
+    freq = handle.get_column_frequency("city")
+    stats = handle.get_column_stats_sample("age")
+    assert handle.cached_column_frequency("city") == freq
+    assert handle.cached_column_stats("age") is stats
+    handle.filter_by_column("city", "berlin")
+    assert handle.cached_column_frequency("city") is None
+
+
+def test_frequency_follows_filter(tmp_path):
+    handle = _load(tmp_path)
+    handle.filter_by_column("city", "berlin")
+    assert handle.get_column_frequency("age") == [
+        {"name": "25", "count": 2, "percent": 100.0},
+    ]
+
+
+def test_sort_is_stable_with_numbers_first(tmp_path):
+    handle = _load(tmp_path)
+    handle.sort_by_column("age")
+    assert _names(handle) == ["bob", "eve", "Alice", "Dave", "Carol"]
+
+
+def test_clear_filter_reapplies_sort(tmp_path):
+    handle = _load(tmp_path)
+    handle.sort_by_column("name")
+    handle.filter_by_column("city", "berlin")
+    handle.clear_filter()
+    assert _names(handle) == ["Alice", "Carol", "Dave", "bob", "eve"]
+
+
+def test_filter_keeps_sort(tmp_path):
+    handle = _load(tmp_path)
+    handle.sort_by_column("name", ascending=False)
+    handle.filter_by_column("city", "i")
+    assert _names(handle) == ["eve", "bob", "Carol", "Alice"]
+    handle.apply_structured_filter({"column": "age", "operator": "eq", "value": "25"})
+    assert _names(handle) == ["eve", "bob"]
+
+
+def test_cached_page_tracks_view_changes(tmp_path):
+    handle = _load(tmp_path)
+    assert _names(handle) == ["Alice", "bob", "Carol", "Dave", "eve"]
+    handle.sort_by_column("name", ascending=False)
+    assert _names(handle) == ["eve", "bob", "Dave", "Carol", "Alice"]
+    handle.rename_column("name", "first")
+    assert handle.get_rows(0, 1)["header"] == ["first", "age", "city"]
+
+
+def test_reads_do_not_wait_for_writers(tmp_path):
+    handle = _load(tmp_path)
+    freq = handle.get_column_frequency("city")
+    held, release = threading.Event(), threading.Event()
+
+    def writer():
+        with handle._lock:
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    held.wait(5)
+    try:
+        assert handle.row_count == 5
+        assert _names(handle) == ["Alice", "bob", "Carol", "Dave", "eve"]
+        assert [c.name for c in handle.get_columns()] == ["name", "age", "city"]
+        assert handle.get_column_frequency("city") == freq
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_sort_keeps_column_stats(tmp_path):
+    handle = _load(tmp_path)
+    stats = handle.get_column_stats_sample("age")
+    handle.sort_by_column("age", ascending=False)
+    assert handle.get_column_stats_sample("age") is stats
+    handle.filter_by_column("city", "berlin")
+    assert handle.get_column_stats_sample("age")["max"] == 25
+
+
+def test_rows_json_matches_rows(tmp_path):
+    handle = _load(tmp_path)
+    handle.sort_by_column("age")
+    assert json.loads(handle.get_rows_json(1, 3)) == handle.get_rows(1, 3)
+
+
+def test_columns_payload_tracks_rename_and_retype(tmp_path):
+    handle = _load(tmp_path)
+    assert handle.get_columns_payload() is handle.get_columns_payload()
+    handle.rename_column("age", "years")
+    handle.set_column_type("years", "float")
+    assert json.loads(handle.get_columns_json())[1] == {"name": "years", "type": "float", "width": None}
+
+
+def test_columnar_rows_match_rows(tmp_path):
+    handle = _load(tmp_path)
+    handle.sort_by_column("city")
+    rows = handle.get_rows(1, 3)
+    columnar = json.loads(handle.get_rows_json(1, 3, columnar=True))
+    assert columnar == handle.get_rows_columnar(1, 3)
+    assert columnar["header"] == rows["header"]
+    assert [list(row) for row in zip(*columnar["columns"])] == rows["rows"]
+
+
+def test_state_and_rows_json(tmp_path):
+    handle = _load(tmp_path)
+    handle.filter_by_column("city", "berlin")
+    state, total, rows = handle.get_state_and_rows_json(0, 10)
+    assert json.loads(state) == handle.get_state()
+    assert total == handle.row_count == 2
+    assert json.loads(rows) == handle.get_rows(0, 10)
+
+
+def test_rows_json_and_total(tmp_path):
+    handle = _load(tmp_path)
+    handle.filter_by_column("city", "berlin")
+    rows, total = handle.get_rows_json_and_total(0, 10)
+    assert json.loads(rows) == handle.get_rows(0, 10)
+    assert total == 2
+
+
+def test_rename_keeps_serialized_pages(tmp_path):
+    handle = _load(tmp_path)
+    rows = handle.get_rows(0, 50)["rows"]
+    handle.rename_column("city", "town")
+    page = handle.get_rows(0, 50)
+    assert page["header"] == ["name", "age", "town"]
+    assert page["rows"] is rows
+    assert json.loads(handle.get_rows_json(0, 50))["header"] == ["name", "age", "town"]
+
+
+def test_row_chunks_come_from_one_view(tmp_path):
+    handle = _load(tmp_path)
+    total, pages = handle.get_rows_json_chunks(0, 5, 2)
+    first = next(pages)
+    handle.filter_by_column("city", "berlin")
+    chunks = [first, *pages]
+    assert total == 5
+    assert [(start, limit) for start, limit, _ in chunks] == [(0, 2), (2, 2), (4, 1)]
+    names = [row[0] for _, _, page in chunks for row in json.loads(page)["rows"]]
+    assert names == ["Alice", "bob", "Carol", "Dave", "eve"]
@@ -0,0 +1,99 @@
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from vdweb import server
+from vdweb.core import load_dataset, set_current_dataset
+
+
+@pytest.fixture
+def client(tmp_path):
+    path = tmp_path / "numbers.csv"
+    path.write_text("n\n" + "".join(f"{i}\n" for i in range(25)))
+    set_current_dataset(load_dataset(str(path)))
+    return TestClient(server.create_app())
+
+
+def test_large_pages_are_sent_in_chunks(client, monkeypatch):
+    monkeypatch.setattr(server, "ROWS_CHUNK_SIZE", 10)
+    with client.websocket_connect("/ws") as ws:
+        assert json.loads(ws.receive_text())["action"] == "server_restart"
+        ws.send_text(json.dumps({"action": "get_rows", "start": 2, "limit": 100}))
+        chunks = [json.loads(ws.receive_text())["data"] for _ in range(3)]
+    assert [c["start"] for c in chunks] == [2, 12, 22]
+    assert [row[0] for c in chunks for row in c["rows"]] == list(range(2, 25))
+    assert {c["total"] for c in chunks} == {25}
+
+
+def test_filter_burst_runs_first_and_last(client, monkeypatch):
+    dataset = server.get_current_dataset()
+    apply_filter, release, calls = dataset.apply_structured_filter, threading.Event(), []
+
+    def slow_filter(payload):
+        calls.append(payload["value"])
+        release.wait(5)
+        apply_filter(payload)
+
+    monkeypatch.setattr(dataset, "apply_structured_filter", slow_filter)
+    with client.websocket_connect("/ws") as ws:
+        ws.receive_text()
+        for value in ("10", "15", "20"):
+            ws.send_text(json.dumps({"action": "apply_filter", "filter_payload": {
+                "column": "n", "operator": "gt", "value": value,
+            }}))
+        ws.send_text(json.dumps({"action": "ping"}))
+        assert json.loads(ws.receive_text())["action"] == "pong"
+        release.set()
+        replies = [json.loads(ws.receive_text()) for _ in range(4)]
+        ws.send_text(json.dumps({"action": "get_rows", "start": 0, "limit": 10}))
+        rows = json.loads(ws.receive_text())["data"]["rows"]
+    assert calls == ["10", "20"]
+    assert [r["action"] for r in replies] == ["filtered", "rows", "filtered", "rows"]
+    assert [row[0] for row in rows] == [21, 22, 23, 24]
+
+
+def test_bad_parameters_get_an_error_reply(client):
+    with client.websocket_connect("/ws") as ws:
+        ws.receive_text()
+        ws.send_text(json.dumps({"action": "get_rows", "start": "0"}))
+        assert json.loads(ws.receive_text()) == {
+            "action": "rows",
+            "success": False,
+            "error": "Invalid 'start' parameter: expected an integer",
+        }
+        ws.send_text("[1, 2]")
+        assert json.loads(ws.receive_text())["success"] is False
+        ws.send_text(json.dumps({"action": "get_rows", "limit": 1}))
+        assert json.loads(ws.receive_text())["data"]["rows"] == [[0]]
+
+
+def test_forced_stats_request_replaces_running_one(client, monkeypatch):
+    dataset = server.get_current_dataset()
+    stats, release = dataset.get_column_stats_sample, threading.Event()
+    running, peak = [], []
+
+    def slow_stats(column):
+        running.append(column)
+        peak.append(len(running))
+        release.wait(5)
+        running.pop()
+        return stats(column)
+
+    monkeypatch.setattr(server, "MAX_CONCURRENT_STATS", 1)
+    monkeypatch.setattr(dataset, "get_column_stats_sample", slow_stats)
+    with client.websocket_connect("/ws") as ws:
+        ws.receive_text()
+        ws.send_text(json.dumps({"action": "get_stats", "column": "n", "req_id": 1}))
+        ws.send_text(json.dumps({"action": "get_stats", "column": "n", "req_id": 2, "force": True}))
+        assert json.loads(ws.receive_text())["data"] == {"column": "n", "data": None, "dropped": True, "req_id": 1}
+        ws.send_text(json.dumps({"action": "ping"}))
+        assert json.loads(ws.receive_text())["action"] == "pong"
+        release.set()
+        reply = json.loads(ws.receive_text())["data"]
+        assert (reply["req_id"], reply["data"]["min"]) == (2, 0)
+        ws.send_text(json.dumps({"action": "ping"}))
+        assert json.loads(ws.receive_text())["action"] == "pong"
+    # The dropped request's thread kept its slot until it returned
+    assert peak == [1, 1]
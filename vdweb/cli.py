@@ -7,9 +7,9 @@ Launches the VisiLens server and opens the web interface.
 from __future__ import annotations
 
 import logging
+import os
 import sys
 import threading
-import time
 import webbrowser
 from pathlib import Path
 import socket
@@ -17,15 +17,45 @@ import socket
 import click
 import uvicorn
 
-from .server import create_app, set_initial_dataset_path
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def is_port_in_use(port: int) -> bool:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) == 0
+class _NotifyingServer(uvicorn.Server):
+    """uvicorn Server that sets `ready` once it is listening."""
+
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config)
+        self.ready = threading.Event()
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if self.started:
+            self.ready.set()
+
+
+def bind_port(host: str, port: int) -> socket.socket | None:
+    """
+    Bind a listening-ready socket to host:port, or return None if it is taken.
+
+    A failed bind() is an immediate EADDRINUSE, unlike probing with a
+    connect. The bound socket is handed to uvicorn so the port is not
+    bound twice (and cannot be grabbed in between).
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if os.name == "nt":
+        # On Windows SO_REUSEADDR would let us bind over a live listener
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        # Lets a restart reuse a port whose old connections are in TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind((host, port))
+    except OSError:
+        sock.close()
+        return None
+    return sock
 
 
 @click.command()
@@ -47,6 +77,9 @@ def main(filename: str | None, host: str, port: int, no_browser: bool):
 
         visilens dataset.json --no-browser
     """
+    # Imported here so that --help does not pay for FastAPI and VisiData
+    from .server import create_app, set_initial_dataset_path
+
     # Set initial dataset if provided
     if filename:
         file_path = Path(filename).resolve()
@@ -57,9 +90,9 @@ def main(filename: str | None, host: str, port: int, no_browser: bool):
         set_initial_dataset_path(str(file_path))
         logger.info(f"Loading dataset: {file_path}")
 
-    # Check if port is in use and find a new one if necessary
+    # Bind the port, moving on to the next one if it is in use
     start_port = port
-    while is_port_in_use(port):
+    while (sock := bind_port(host, port)) is None:
         logger.warning(f"Port {port} is in use, trying {port + 1}")
         port += 1
         if port - start_port > 100:
@@ -68,11 +101,19 @@ def main(filename: str | None, host: str, port: int, no_browser: bool):
 
     # Create the FastAPI app
     app = create_app()
-
-    # Open browser after a short delay (in background thread)
+    server = _NotifyingServer(uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        access_log=False  # Reduce noise
+    ))
+
+    # Open browser once the server is listening (in background thread)
     if not no_browser:
         def open_browser():
-            time.sleep(1.5)  # Wait for server to start
+            if not server.ready.wait(timeout=10):
+                return  # Startup failed or is stuck; don't open a dead page
             url = f"http://{host}:{port}"
             logger.info(f"Opening browser: {url}")
             webbrowser.open(url)
@@ -93,16 +134,12 @@ def main(filename: str | None, host: str, port: int, no_browser: bool):
 
     # Run the server
     try:
-        uvicorn.run(
-            app,
-            host=host,
-            port=port,
-            log_level="info",
-            access_log=False  # Reduce noise
-        )
+        server.run(sockets=[sock])
     except KeyboardInterrupt:
         click.echo("\n\nShutting down VisiLens. Goodbye!")
         sys.exit(0)
+    if not server.started:
+        sys.exit(3)  # uvicorn's startup-failure exit code, as uvicorn.run uses
 
 
 if __name__ == '__main__':
@@ -10,17 +10,58 @@ from __future__ import annotations
 
 import logging
 import collections
+import csv
+import itertools
+import json
 import math
+import operator as _operator
+import re
 import threading
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
-import visidata
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# VisiData pulls in its whole loader graph on import, so it is only
+# imported once a dataset is actually loaded (see _vd())
+visidata = None
+
+
+def _vd():
+    """Return the visidata module, importing it on first use."""
+    global visidata
+    if visidata is None:
+        import visidata as _visidata
+        visidata = _visidata
+    return visidata
+
+
+# Types whose values VisiData returns unchanged from getTypedValue()
+_PLAIN_TYPES = (str, int, float, bool)
+
+# Exact types treated as plain numbers by the column stats
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+# Cell types that are already JSON-safe as they are
+_JSON_SAFE_TYPES = frozenset((str, int, bool, type(None)))
+
+# Text columns whose sampled distinct/total ratio is at most this share
+# one string object per distinct value
+_REPEATED_TEXT_RATIO = 0.1
+
+# Number of serialized get_rows pages kept per dataset
+_PAGE_CACHE_SIZE = 32
+
+# Number of columns whose lowercased text is kept for substring filters
+_LOWERED_CACHE_SIZE = 8
+
+# Most substring searches kept per chain of search-as-you-type filters
+_SEARCH_CHAIN_SIZE = 16
+
 
 @dataclass
 class ColumnInfo:
@@ -30,6 +71,54 @@ class ColumnInfo:
     width: int | None = None
 
 
+@dataclass(frozen=True)
+class _View:
+    """
+    Immutable snapshot of the visible rows and the sort/filter behind them.
+
+    The visible rows are rows[i] for each i in index (all rows, in load
+    order, when index is None); they are only gathered a page at a time.
+    Writers replace the handle's view wholesale and never modify a
+    published list. Each view carries its own page cache, so a new view
+    starts with an empty one (a rename carries the old pages over).
+    """
+    rows: list[Any]
+    index: list[int] | None = None
+    sort: tuple[str, bool] | None = None
+    filter: tuple[str, str] | None = None
+    pages: collections.OrderedDict[tuple, Any] = field(default_factory=collections.OrderedDict, compare=False)  # LRU of serialized get_rows pages
+    pages_lock: threading.Lock = field(default_factory=threading.Lock, compare=False, repr=False)  # guards pages; readers fill it concurrently
+
+    def __len__(self) -> int:
+        return len(self.rows) if self.index is None else len(self.index)
+
+    def page_rows(self, start: int, limit: int) -> list[Any]:
+        """The visible rows from start, at most limit of them."""
+        if self.index is None:
+            return self.rows[start:start + limit]
+        return list(map(self.rows.__getitem__, self.index[start:start + limit]))
+
+    def cached_page(self, key: tuple) -> Any:
+        """Return a cached page (or None), marking it most recently used."""
+        with self.pages_lock:
+            page = self.pages.get(key)
+            if page is not None:
+                self.pages.move_to_end(key)
+        return page
+
+    def cache_page(self, key: tuple, page: Any) -> None:
+        """Cache a page, evicting the least recently used one when full."""
+        with self.pages_lock:
+            self.pages[key] = page
+            if len(self.pages) > _PAGE_CACHE_SIZE:
+                self.pages.popitem(last=False)
+
+    def cached_pages(self) -> list[tuple[tuple, Any]]:
+        """Snapshot of the cached (key, page) pairs, least recently used first."""
+        with self.pages_lock:
+            return list(self.pages.items())
+
+
 @dataclass
 class DatasetHandle:
     """
@@ -41,42 +130,261 @@ class DatasetHandle:
     sheet: Any  # visidata.Sheet
     path: str
     _lock: threading.RLock = field(default_factory=threading.RLock)
-    _original_rows: list[Any] | None = field(default=None, init=False)
+    _original_rows: list[Any] = field(default_factory=list, init=False)  # load-order rows; the list itself is never modified
     _current_sort: tuple[str, bool] | None = field(default=None, init=False)  # (column_name, ascending)
     _current_filter: tuple[str, str] | None = field(default=None, init=False)  # (column_name, search_term)
     _stats_cache: dict[str, Any] = field(default_factory=dict, init=False)
-    _sample_rows: list[Any] | None = field(default=None, init=False)
+    _freq_cache: dict[str, tuple[list[tuple[Any, int]], int]] = field(default_factory=dict, init=False)  # column name -> (values ranked by count, total)
+    _sample_index: Sequence[int] | None = field(default=None, init=False)  # load-order positions of the sampled rows
+    _columns: dict[str, list[Any]] = field(default_factory=dict, init=False)  # column name -> values in load order
+    _lowered: collections.OrderedDict[str, list[str]] = field(default_factory=collections.OrderedDict, init=False)  # LRU: column name -> lowercased text in load order
+    _searches: list[tuple[str, str, list[int]]] = field(default_factory=list, init=False)  # (column name, lowercased term, matches) of recent substring filters, each term containing the one before
+    _row_index: list[int] | None = field(default=None, init=False)  # load-order positions of the visible rows (None = all, in load order)
+    _sort_index: list[int] | None = field(default=None, init=False)  # every load-order position, in sort order
+    _filter_index: list[int] | None = field(default=None, init=False)  # load-order positions passing the filter
+    _col_by_name: dict[str, Any] = field(default_factory=dict, init=False)  # column name -> VisiData column
+    _col_fast_idx: dict[str, int | None] = field(default_factory=dict, init=False)  # column name -> cell index in list rows
+    _rows_are_lists: bool = field(default=False, init=False)
+    _columns_version: int = field(default=0, init=False)  # bumped after every column rename/retype
+    _columns_cache: tuple[int, list[dict[str, Any]], str] | None = field(default=None, init=False)  # (version, payload, JSON) for get_columns_payload()
+    _view: _View | None = field(default=None, init=False)  # published snapshot for lock-free readers
+
+    def __post_init__(self) -> None:
+        rows = self._original_rows = self.sheet.rows
+        self._rows_are_lists = bool(rows) and isinstance(rows[0], list)
+        self._index_columns()
+        self._publish()
+
+    def _publish(self) -> None:
+        """
+        Publish the current rows and sort/filter state as a new snapshot.
+
+        Called by writers (under the lock) once an operation is complete.
+        Readers pick up the snapshot with a single attribute read, so they
+        never wait for a long sort or filter to finish.
+        """
+        self._view = _View(self._base_rows(), self._row_index, self._current_sort, self._current_filter)
+
+    def _index_columns(self) -> None:
+        """Rebuild the name -> column lookups (first column wins on duplicates)."""
+        self._col_by_name = {}
+        for col in self.sheet.columns:
+            self._col_by_name.setdefault(col.name, col)
+        self._col_fast_idx = {
+            name: _cell_index(col) for name, col in self._col_by_name.items()
+        }
+
+    def _fast_index(self, col: Any) -> int | None:
+        """Index of the column's cell when rows are plain lists, else None."""
+        return self._col_fast_idx.get(col.name) if self._rows_are_lists else None
 
     @property
     def row_count(self) -> int:
         """Total number of rows in the dataset."""
-        with self._lock:
-            return len(self.sheet.rows)
+        return len(self._view)
 
     @property
     def column_count(self) -> int:
         """Total number of columns in the dataset."""
-        with self._lock:
-            return len(self.sheet.columns)
+        return len(self.sheet.columns)
+
+    def _base_rows(self) -> list[Any]:
+        """Rows in load order, independent of the current sort/filter."""
+        return self._original_rows
+
+    def _column_values(self, col: Any) -> list[Any]:
+        """
+        Return the raw values of a column for every loaded row.
+
+        The column is materialized once (struct-of-arrays) and reused by
+        the column-oriented operations, so a scan touches one flat list
+        instead of indexing into every row object.
+        """
+        values = self._columns.get(col.name)
+        if values is None:
+            values = _extract_column(col, self._base_rows(), self._fast_index(col))
+            self._columns[col.name] = values
+        return values
+
+    def _lowered_values(self, col: Any) -> list[str]:
+        """
+        Return the lowercased text of a column for every loaded row.
+
+        Built on the first substring filter and reused by the following
+        ones, so search-as-you-type only pays for the `in` test. Only the
+        most recently filtered columns are kept, bounding the memory a
+        wide sheet can pin.
+        """
+        lowered = self._lowered.get(col.name)
+        if lowered is None:
+            lowered = [str(value).lower() for value in self._column_values(col)]
+            self._lowered[col.name] = lowered
+            if len(self._lowered) > _LOWERED_CACHE_SIZE:
+                self._lowered.popitem(last=False)
+        else:
+            self._lowered.move_to_end(col.name)
+        return lowered
+
+    def _visible_values(self, col: Any) -> list[Any]:
+        """
+        Return the values of a column for the rows currently shown.
+
+        Sorting only permutes rows, so without a filter the load-order
+        column can be used directly for order-independent computations.
+        """
+        values = self._column_values(col)
+        if self._current_filter is None or self._row_index is None:
+            return values
+        return list(map(values.__getitem__, self._row_index))
+
+    def _typed_values(self, col: Any) -> list[Any]:
+        """
+        Return col.getTypedValue() for every loaded row, in load order.
+
+        Raw values that the column type would return unchanged are reused
+        as-is; only the rest go through VisiData's typed getter.
+        """
+        values = self._column_values(col)
+        if col.type is _vd().anytype:
+            plain = _PLAIN_TYPES
+        elif col.type in _PLAIN_TYPES:
+            plain = (col.type,)
+        else:
+            plain = ()
+        base = self._base_rows()
+        return [
+            val if type(val) in plain else col.getTypedValue(row)
+            for row, val in zip(base, values)
+        ]
+
+    def _set_view(self, index: list[int] | None) -> None:
+        """
+        Show the load-order rows at the given positions (None = all).
+
+        Only the positions are kept: sheet.rows stays the load-order list,
+        and pages gather their rows from it on demand.
+        """
+        self._row_index = index
+
+    def _refresh_view(self) -> None:
+        """
+        Show the rows passing the filter, in sort order.
+
+        Sort and filter are kept apart, as a permutation of every row and
+        the positions that match, so changing one reuses the other: a
+        filter keeps the current sort without sorting again.
+        """
+        order, matches = self._sort_index, self._filter_index
+        if order is None or matches is None:
+            self._set_view(order if matches is None else matches)
+            return
+        keep = bytearray(len(self._base_rows()))
+        for i in matches:
+            keep[i] = 1
+        self._set_view(list(itertools.compress(order, map(keep.__getitem__, order))))
+
+    def _sorted_index(self, col: Any, ascending: bool) -> list[int]:
+        """
+        Return the load-order positions of all rows ordered by a column.
+
+        Sort keys are computed once into a list, and the positions are
+        sorted with that list's __getitem__ as the key function - an
+        argsort with no Python-level callback per row. Numbers sort before
+        everything else, which is compared as text; rows without a value
+        are kept out of the sort and always placed last.
+        """
+        # Start from the current sort order, so that ties keep it
+        current = self._sort_index
+        if self._fast_index(col) is not None:
+            # Fast path for list-based rows (CSV): sort on the raw cells
+            values = self._column_values(col)
+            if current is not None:
+                values = list(map(values.__getitem__, current))
+        else:
+            # Slow path: use VisiData's typed value getter
+            base = self._base_rows()
+            rows = base if current is None else map(base.__getitem__, current)
+            values = [_typed_sort_value(col, row) for row in rows]
+
+        kinds = set(map(type, values))
+        has_nulls = type(None) in kinds
+        kinds.discard(type(None))
+        if kinds <= _NUMERIC_TYPES or kinds == {str}:
+            # Homogeneous column: the values are their own sort keys
+            if has_nulls:
+                positions = [p for p, val in enumerate(values) if val is not None]
+            else:
+                positions = list(range(len(values)))
+            positions.sort(key=values.__getitem__, reverse=not ascending)
+        else:
+            # Mixed column: sort numbers and text as separate groups rather
+            # than building a (group, value) tuple for every row
+            numbers = [p for p, val in enumerate(values) if isinstance(val, (int, float))]
+            numbers.sort(key=values.__getitem__, reverse=not ascending)
+            others = [
+                p for p, val in enumerate(values)
+                if val is not None and not isinstance(val, (int, float))
+            ]
+            text = [str(values[p]) for p in others]
+            order = sorted(range(len(others)), key=text.__getitem__, reverse=not ascending)
+            others = list(map(others.__getitem__, order))
+            positions = numbers + others if ascending else others + numbers
+        if has_nulls:
+            positions.extend(p for p, val in enumerate(values) if val is None)
+        if current is None:
+            return positions
+        return list(map(current.__getitem__, positions))
 
     def get_columns(self) -> list[ColumnInfo]:
         """
         Return column metadata (name, type, width).
 
         VisiData column types are mapped to string representations
-        for JSON serialization.
+        for JSON serialization. Writers only assign column attributes,
+        so this reads them without the lock and never waits behind a
+        long sort or filter.
         """
-        with self._lock:
-            columns = []
-            for col in self.sheet.columns:
-                # Map VisiData type to string representation
-                type_name = _get_type_name(col.type)
-                columns.append(ColumnInfo(
-                    name=col.name,
-                    type=type_name,
-                    width=getattr(col, 'width', None)
-                ))
-            return columns
+        columns = []
+        for col in list(self.sheet.columns):
+            # Map VisiData type to string representation
+            type_name = _get_type_name(col.type)
+            columns.append(ColumnInfo(
+                name=col.name,
+                type=type_name,
+                width=getattr(col, 'width', None)
+            ))
+        return columns
+
+    def _columns_cached(self) -> tuple[int, list[dict[str, Any]], str]:
+        """
+        Return (version, payload, JSON) for the current column metadata.
+
+        Lock-free like get_columns(). The entry is tagged with the version
+        read before building it, so one raced by a rename or retype is
+        simply rebuilt by the next caller.
+        """
+        version = self._columns_version
+        cached = self._columns_cache
+        if cached is None or cached[0] != version:
+            payload = [
+                {"name": c.name, "type": c.type, "width": c.width}
+                for c in self.get_columns()
+            ]
+            cached = self._columns_cache = (version, payload, encode_json(payload).decode())
+        return cached
+
+    def get_columns_payload(self) -> list[dict[str, Any]]:
+        """
+        Return get_columns() as the list of dicts sent to API clients.
+
+        Cached until the next rename/retype; the list is shared between
+        callers and must not be modified.
+        """
+        return self._columns_cached()[1]
+
+    def get_columns_json(self) -> str:
+        """Return get_columns_payload() encoded as a compact JSON array."""
+        return self._columns_cached()[2]
 
     def get_rows(self, start: int = 0, limit: int = 50) -> dict[str, Any]:
         """
@@ -85,50 +393,108 @@ class DatasetHandle:
         Returns:
             Dict with 'header' (list of col names) and 'rows' (list of lists of values).
         """
-        with self._lock:
-            rows = self.sheet.rows[start:start + limit]
-            columns = self.sheet.columns
+        return self._page(self._view, start, limit)
 
-            header = [c.name for c in columns]
-            result_rows = []
-            
-            # Optimization: Pre-calculate column indices for fast access
-            col_indices = []
-            for col in columns:
-                if hasattr(col, 'expr') and isinstance(col.expr, int):
-                    col_indices.append((col.expr, True))
-                else:
-                    col_indices.append((col, False))
+    def get_rows_columnar(self, start: int = 0, limit: int = 50) -> dict[str, Any]:
+        """
+        Return a slice of rows as one value list per column.
 
-            for row in rows:
-                row_values = []
-                is_list_row = isinstance(row, list)
-                
-                for col_or_idx, is_index in col_indices:
-                    try:
-                        if is_list_row and is_index:
-                            val = row[col_or_idx]
-                            row_values.append(_serialize_value(val))
-                        else:
-                            col = col_or_idx
-                            value = col.getTypedValue(row)
-                            row_values.append(_serialize_value(value))
-                    except Exception:
-                        col = col_or_idx if not is_index else next(c for c in columns if c.expr == col_or_idx)
-                        row_values.append(col.getDisplayValue(row))
-                result_rows.append(row_values)
-                
-            return {
-                "header": header,
-                "rows": result_rows
-            }
+        Returns:
+            Dict with 'header' (list of col names) and 'columns' (one list of
+            values per column, in header order). Skips the transpose into
+            rows that get_rows() does.
+        """
+        return self._columnar_page(self._view, start, limit)
+
+    def get_rows_json(self, start: int = 0, limit: int = 50, columnar: bool = False) -> str:
+        """
+        Return get_rows() (or get_rows_columnar()) already encoded as a compact JSON object.
+
+        The encoded text is cached next to the page, so the API layer can
+        send a repeated page without encoding it again.
+        """
+        return self._rows_json(self._view, start, limit, columnar)
+
+    def get_rows_json_chunks(
+        self, start: int, limit: int, chunk_size: int, columnar: bool = False
+    ) -> tuple[int, Iterator[tuple[int, int, str]]]:
+        """
+        Return (row count, pages) for rows start..start+limit, taken from
+        one view snapshot.
+
+        pages yields (start, limit, get_rows_json()) for consecutive chunks
+        of at most chunk_size rows, and at least one (possibly empty) page.
+        A sort or filter published while the pages are consumed does not
+        mix into them.
+        """
+        view = self._view
+
+        def pages() -> Iterator[tuple[int, int, str]]:
+            pos, end = start, start + limit
+            while True:
+                chunk = min(chunk_size, end - pos)
+                yield pos, chunk, self._rows_json(view, pos, chunk, columnar)
+                pos += chunk
+                if pos >= min(end, len(view)):
+                    break
+
+        return len(view), pages()
+
+    def _rows_json(self, view: _View, start: int, limit: int, columnar: bool = False) -> str:
+        """Encoded page of a view, from its page cache when possible."""
+        key = ("json-columnar" if columnar else "json", start, limit)
+        text = view.cached_page(key)
+        if text is None:
+            page = self._columnar_page(view, start, limit) if columnar else self._page(view, start, limit)
+            text = encode_json(page).decode()
+            view.cache_page(key, text)
+        return text
+
+    def _page(self, view: _View, start: int, limit: int) -> dict[str, Any]:
+        """Serialized rows of a view, from its page cache when possible."""
+        key = (start, limit)
+        page = view.cached_page(key)
+        if page is None:
+            page = self._build_page(view.page_rows(start, limit))
+            view.cache_page(key, page)
+        return page
+
+    def _columnar_page(self, view: _View, start: int, limit: int) -> dict[str, Any]:
+        """Serialized columns of a view's page, from its page cache when possible."""
+        key = ("columnar", start, limit)
+        page = view.cached_page(key)
+        if page is None:
+            header, col_values = self._page_columns(view.page_rows(start, limit))
+            page = {"header": header, "columns": col_values}
+            view.cache_page(key, page)
+        return page
+
+    def _page_columns(self, rows: list[Any]) -> tuple[list[str], list[list[Any]]]:
+        """Serialize a page of rows column by column."""
+        columns = self.sheet.columns
+        header = [c.name for c in columns]
+        # Type dispatch happens once per column instead of once per cell
+        return header, [_serialize_column(col, rows, self._rows_are_lists) for col in columns]
+
+    def _build_page(self, rows: list[Any]) -> dict[str, Any]:
+        """Serialize a page of rows."""
+        header, col_values = self._page_columns(rows)
+        if not col_values:
+            return {"header": header, "rows": [[] for _ in rows]}
+
+        # Transpose the serialized columns into rows
+        return {
+            "header": header,
+            "rows": list(map(list, zip(*col_values)))
+        }
 
     def sort_by_column(self, column_name: str, ascending: bool = True) -> None:
         """
         Sort rows by the specified column.
 
-        Uses VisiData's column value getter to sort rows in place.
-        Stores the original row order on first sort for potential reset.
+        Orders the visible rows by the column's values; missing values
+        always go last. Stores the original row order on first sort for
+        potential reset.
 
         Args:
             column_name: Name of the column to sort by
@@ -138,78 +504,19 @@ class DatasetHandle:
             ValueError: If column not found
         """
         with self._lock:
-            # Store original rows if this is the first sort/filter operation
-            if self._original_rows is None:
-                self._original_rows = self.sheet.rows[:]
-
             # Find the column
-            col = next((c for c in self.sheet.columns if c.name == column_name), None)
+            col = self._col_by_name.get(column_name)
             if col is None:
                 raise ValueError(f"Column '{column_name}' not found")
 
-            # Optimization: Fast path for list-based rows (CSV)
-            # Direct index access avoids VisiData's getter overhead
-            if hasattr(col, 'expr') and isinstance(col.expr, int) and self.sheet.rows and isinstance(self.sheet.rows[0], list):
-                idx = col.expr
-                
-                # Define key function optimized for direct access
-                # We use a tuple (type_group, value) to handle mixed types safely
-                # Group 0: Numbers (int, float)
-                # Group 1: Strings/Others
-                # Group 2: None (always last if ascending)
-                
-                # Pre-calculate constants to avoid closure lookup overhead
-                NONE_KEY = (2, None) if ascending else (0, None)
-                
-                def fast_key(row):
-                    try:
-                        val = row[idx]
-                        if val is None:
-                            return NONE_KEY
-                        
-                        if isinstance(val, (int, float)):
-                            return (0, val)
-                        
-                        # Fallback for strings or other types
-                        return (1, str(val))
-                    except IndexError:
-                        return NONE_KEY
-
-                # In-place sort is slightly faster than sorted()
-                self.sheet.rows.sort(key=fast_key, reverse=not ascending)
-
-            else:
-                # Slow path: use VisiData's column value getter
-                # Handle potential errors in getTypedValue by falling back to string comparison
-                def sort_key(row: Any) -> Any:
-                    try:
-                        val = col.getTypedValue(row)
-                        # Handle None values (sort them to the end)
-                        if val is None:
-                            return (2, None) if ascending else (0, None)
-                        
-                        # Check if value matches column type (e.g. float)
-                        # If column type is float but val is string (conversion failed),
-                        # we treat it as a different group to avoid comparison errors.
-                        if isinstance(val, (int, float)):
-                            return (0, val)
-                        else:
-                            # Failed conversion or other type
-                            return (1, str(val))
-                    except Exception:
-                        # Fallback to display value for comparison
-                        return (1, col.getDisplayValue(row))
-
-                self.sheet.rows.sort(
-                    key=sort_key,
-                    reverse=not ascending
-                )
+            self._sort_index = self._sorted_index(col, ascending)
+            self._refresh_view()
 
             # Track current sort state
             self._current_sort = (column_name, ascending)
-            # Invalidate stats cache as order/sample might change (though distribution of full col doesn't, sample might)
-            self._stats_cache.clear()
-            self._sample_rows = None
+            # Sorting keeps the same rows, so the stats, frequency and the
+            # sample (load-order positions) all stay valid
+            self._publish()
 
     def filter_by_column(self, column_name: str, search_term: str) -> None:
         """
@@ -226,34 +533,43 @@ class DatasetHandle:
             ValueError: If column not found
         """
         with self._lock:
-            # Store original rows if this is the first operation
-            if self._original_rows is None:
-                self._original_rows = self.sheet.rows[:]
-
             # Find the column
-            col = next((c for c in self.sheet.columns if c.name == column_name), None)
+            col = self._col_by_name.get(column_name)
             if col is None:
                 raise ValueError(f"Column '{column_name}' not found")
 
             # Start from original rows (to allow cumulative filtering)
-            source_rows = self._original_rows
+            lowered = self._lowered_values(col)
 
             # Filter rows (case-insensitive substring search)
             search_lower = search_term.lower()
-            filtered = []
-            for row in source_rows:
-                try:
-                    value = str(col.getValue(row))
-                    if search_lower in value.lower():
-                        filtered.append(row)
-                except Exception:
-                    # Skip rows that cause errors
-                    continue
-
-            self.sheet.rows = filtered
+            # Keep only the earlier searches this term contains (a
+            # backspace drops the longer ones, a new column drops all)
+            searches = self._searches
+            while searches and not (searches[-1][0] == column_name and searches[-1][1] in search_lower):
+                searches.pop()
+            if searches and searches[-1][1] == search_lower:
+                # Same term again (e.g. after a backspace and retype)
+                matches = searches[-1][2]
+            else:
+                if searches:
+                    # The term grew (search-as-you-type): only rows that
+                    # matched the shorter term can match it
+                    matches = [i for i in searches[-1][2] if search_lower in lowered[i]]
+                else:
+                    matches = [
+                        i for i, text in enumerate(lowered)
+                        if search_lower in text
+                    ]
+                searches.append((column_name, search_lower, matches))
+                del searches[:-_SEARCH_CHAIN_SIZE]
+            self._filter_index = matches
+            self._refresh_view()
             self._current_filter = (column_name, search_term)
             self._stats_cache.clear()
-            self._sample_rows = None
+            self._freq_cache.clear()
+            self._publish()
+            self._sample_index = None
 
     def apply_structured_filter(self, filter_payload: dict[str, Any] | None) -> None:
         """
@@ -265,19 +581,12 @@ class DatasetHandle:
                 - Multiple conditions: {'type': 'basic', 'conditions': [...]}
         """
         with self._lock:
-            logger.info(f"Applying structured filter: {filter_payload}")
+            logger.info("Applying structured filter: %s", filter_payload)
             # Reset if payload is None or "reset"
             if not filter_payload or filter_payload == "reset":
                 self.clear_filter()
                 return
 
-            # Store original rows if this is the first operation
-            if self._original_rows is None:
-                self._original_rows = self.sheet.rows[:]
-
-            # Reset to original rows before applying new filter
-            self.sheet.rows = self._original_rows[:]
-            
             # Clear any existing selection
             if hasattr(self.sheet, 'selected'):
                 self.sheet.selected = []
@@ -286,7 +595,7 @@ class DatasetHandle:
             conditions = filter_payload.get("conditions")
             if conditions and isinstance(conditions, list):
                 # Multi-condition filter (AND logic)
-                rows_to_select = []
+                indices = []
                 
                 # Preprocess all conditions
                 condition_data = []
@@ -298,7 +607,7 @@ class DatasetHandle:
                     if not column_name or not operator:
                         continue
                     
-                    col = next((c for c in self.sheet.columns if c.name == column_name), None)
+                    col = self._col_by_name.get(column_name)
                     if col is None:
                         continue
                     
@@ -308,7 +617,10 @@ class DatasetHandle:
                     # Cast value
                     target_val = self._safe_cast(value, 'float' if is_numeric else 'str')
                     
-                    logger.info(f"Filter condition: col={column_name}, op={operator}, val={value} -> target={target_val} (numeric={is_numeric})")
+                    logger.info(
+                        "Filter condition: col=%s, op=%s, val=%s -> target=%s (numeric=%s)",
+                        column_name, operator, value, target_val, is_numeric,
+                    )
 
                     condition_data.append({
                         'col': col,
@@ -317,40 +629,19 @@ class DatasetHandle:
                         'is_numeric': is_numeric
                     })
                 
-                # Apply all conditions (AND logic)
-                for row in self.sheet.rows:
-                    all_match = True
-                    for cond_info in condition_data:
-                        try:
-                            cell_val = cond_info['col'].getTypedValue(row)
-                            
-                            # Handle None/Empty
-                            if cell_val is None:
-                                if cond_info['operator'] == 'is_empty':
-                                    continue  # This condition passed
-                                else:
-                                    all_match = False
-                                    break
-                            
-                            # Check this condition
-                            match = self._evaluate_condition(
-                                cell_val,
-                                cond_info['operator'],
-                                cond_info['target_val'],
-                                cond_info['is_numeric']
-                            )
-                            
-                            if not match:
-                                all_match = False
-                                break
-                        except Exception:
-                            all_match = False
-                            break
-                    
-                    if all_match:
-                        rows_to_select.append(row)
+                # Apply all conditions (AND logic), narrowing the surviving
+                # rows one condition at a time
+                indices = range(len(self._base_rows()))
+                for cond_info in condition_data:
+                    match = self._compile_condition(
+                        cond_info['operator'],
+                        cond_info['target_val'],
+                        cond_info['is_numeric']
+                    )
+                    indices = _select_matching(indices, self._typed_values(cond_info['col']), match)
                 
-                self.sheet.rows = rows_to_select
+                self._filter_index = list(indices)
+                self._refresh_view()
                 self._current_filter = ("multiple", f"{len(conditions)} conditions")
                 
             else:
@@ -362,7 +653,7 @@ class DatasetHandle:
                 if not column_name or not operator:
                     return
 
-                col = next((c for c in self.sheet.columns if c.name == column_name), None)
+                col = self._col_by_name.get(column_name)
                 if col is None:
                     raise ValueError(f"Column '{column_name}' not found")
 
@@ -373,36 +664,24 @@ class DatasetHandle:
                 # Cast the filter value
                 target_val = self._safe_cast(value, 'float' if is_numeric else 'str')
 
-                rows_to_select = []
-                for row in self.sheet.rows:
-                    try:
-                        cell_val = col.getTypedValue(row)
-                        
-                        # Handle None/Empty
-                        if cell_val is None:
-                            if operator == 'is_empty':
-                                rows_to_select.append(row)
-                            continue
-
-                        # Check condition
-                        match = self._evaluate_condition(cell_val, operator, target_val, is_numeric)
-                        if match:
-                            rows_to_select.append(row)
-
-                    except Exception:
-                        continue
+                match = self._compile_condition(operator, target_val, is_numeric)
+                indices = _select_matching(range(len(self._base_rows())), self._typed_values(col), match)
+
+                # Filter to show only matching rows
+                self._filter_index = indices
+                self._refresh_view()
 
                 # Use VisiData API to select rows
                 if hasattr(self.sheet, 'select'):
-                    self.sheet.select(rows_to_select)
-                
-                # Filter to show only selected
-                self.sheet.rows = rows_to_select
+                    base = self._base_rows()
+                    self.sheet.select([base[i] for i in indices])
                 
                 self._current_filter = (column_name, f"{operator} {value}")
             
             self._stats_cache.clear()
-            self._sample_rows = None
+            self._freq_cache.clear()
+            self._publish()
+            self._sample_index = None
 
     def _safe_cast(self, val, to_type):
         """Helper to cast value safely."""
@@ -417,36 +696,42 @@ class DatasetHandle:
         except (ValueError, TypeError):
             return val
 
-    def _evaluate_condition(self, cell_val, operator, target_val, is_numeric):
-        """Evaluate a single filter condition."""
-        try:
-            if operator == 'eq':
-                return cell_val == target_val
-            elif operator == 'neq':
-                return cell_val != target_val
-            elif operator == 'gt':
-                if is_numeric and isinstance(cell_val, (int, float)) and isinstance(target_val, (int, float)):
-                    return cell_val > target_val
-                if not is_numeric and isinstance(cell_val, str) and isinstance(target_val, str):
-                    return cell_val > target_val
-                return False
-            elif operator == 'lt':
-                if is_numeric and isinstance(cell_val, (int, float)) and isinstance(target_val, (int, float)):
-                    return cell_val < target_val
-                if not is_numeric and isinstance(cell_val, str) and isinstance(target_val, str):
-                    return cell_val < target_val
-                return False
-            elif operator == 'contains':
-                return str(target_val).lower() in str(cell_val).lower()
-            elif operator == 'regex_match':
-                import re
-                return bool(re.search(str(target_val), str(cell_val), re.IGNORECASE))
-            elif operator == 'is_empty':
-                return cell_val == "" or cell_val is None
-            return False
-        except Exception as e:
-            logger.warning(f"Error evaluating condition: {e}")
-            return False
+    def _compile_condition(self, operator, target_val, is_numeric):
+        """
+        Build a predicate for a single filter condition.
+
+        The operator, target type and regex are resolved once here so the
+        per-cell work is a single comparison. Missing values only match
+        'is_empty'.
+        """
+        if operator == 'eq':
+            match = lambda cell_val: cell_val == target_val
+        elif operator == 'neq':
+            match = lambda cell_val: cell_val != target_val
+        elif operator in ('gt', 'lt'):
+            compare = _operator.gt if operator == 'gt' else _operator.lt
+            if is_numeric and isinstance(target_val, (int, float)):
+                kinds = (int, float)
+            elif not is_numeric and isinstance(target_val, str):
+                kinds = str
+            else:
+                return lambda cell_val: False
+            match = lambda cell_val: isinstance(cell_val, kinds) and compare(cell_val, target_val)
+        elif operator == 'contains':
+            needle = str(target_val).lower()
+            match = lambda cell_val: needle in str(cell_val).lower()
+        elif operator == 'regex_match':
+            try:
+                search = re.compile(str(target_val), re.IGNORECASE).search
+            except re.error as e:
+                logger.warning("Error evaluating condition: %s", e)
+                return lambda cell_val: False
+            match = lambda cell_val: search(str(cell_val)) is not None
+        elif operator == 'is_empty':
+            return lambda cell_val: cell_val is None or cell_val == ""
+        else:
+            return lambda cell_val: False
+        return lambda cell_val: cell_val is not None and match(cell_val)
 
     def clear_filter(self) -> None:
         """
@@ -455,45 +740,31 @@ class DatasetHandle:
         Preserves current sort order if sorting was applied.
         """
         with self._lock:
-            if self._original_rows is not None:
-                self.sheet.rows = self._original_rows[:]
+            if self._filter_index is not None:
+                # The sort permutation covers every row, so it is reused as is
+                self._filter_index = None
                 self._current_filter = None
-
-                # Reapply sort if there was one
-                if self._current_sort is not None:
-                    column_name, ascending = self._current_sort
-                    # Re-sort without storing original rows again
-                    col = next((c for c in self.sheet.columns if c.name == column_name), None)
-                    if col:
-                        def sort_key(row: Any) -> Any:
-                            try:
-                                val = col.getTypedValue(row)
-                                if val is None:
-                                    return (1, None) if ascending else (0, None)
-                                return (0, val)
-                            except Exception:
-                                return (0, col.getDisplayValue(row))
-
-                        self.sheet.rows = sorted(
-                            self.sheet.rows,
-                            key=sort_key,
-                            reverse=not ascending
-                        )
+                self._refresh_view()
             self._stats_cache.clear()
-            self._sample_rows = None
+            self._freq_cache.clear()
+            self._publish()
+            self._sample_index = None
 
     def reset(self) -> None:
         """
         Reset to original state (clear all sorts and filters).
         """
         with self._lock:
-            if self._original_rows is not None:
-                self.sheet.rows = self._original_rows[:]
-                self._original_rows = None
+            self._sort_index = None
+            self._filter_index = None
+            if self._row_index is not None:
+                self._set_view(None)
             self._current_sort = None
             self._current_filter = None
             self._stats_cache.clear()
-            self._sample_rows = None
+            self._freq_cache.clear()
+            self._publish()
+            self._sample_index = None
 
     def set_column_type(self, col_name: str, new_type_str: str) -> None:
         """
@@ -511,7 +782,7 @@ class DatasetHandle:
         """
         with self._lock:
             # Find the column
-            col = next((c for c in self.sheet.columns if c.name == col_name), None)
+            col = self._col_by_name.get(col_name)
             if col is None:
                 raise ValueError(f"Column '{col_name}' not found")
             
@@ -522,7 +793,7 @@ class DatasetHandle:
                 'float': float,
                 'str': str,
                 'string': str,
-                'date': visidata.date,
+                'date': _vd().date,
                 'bool': bool,
                 'boolean': bool,
             }
@@ -533,14 +804,20 @@ class DatasetHandle:
             
             # Set the column type
             col.type = new_type
+            self._columns_version += 1
             
             # CRITICAL: Convert the underlying data to match the new type
             # This ensures that getTypedValue returns the correct type
-            _convert_column_data(col, self.sheet.rows)
+            _convert_column_data(col, self._base_rows())
             
             # Clear caches to force recomputation with new type
+            self._columns.pop(col.name, None)
+            self._lowered.pop(col.name, None)
+            self._searches.clear()
             self._stats_cache.clear()
-            self._sample_rows = None
+            self._freq_cache.clear()
+            self._publish()
+            self._sample_index = None
 
     def rename_column(self, old_name: str, new_name: str) -> None:
         """
@@ -564,20 +841,37 @@ class DatasetHandle:
             new_name = new_name.strip()
             
             # Check if new name already exists (case-sensitive)
-            if any(c.name == new_name for c in self.sheet.columns):
+            if new_name in self._col_by_name:
                 raise ValueError(f"Column '{new_name}' already exists")
             
             # Find the column by old name
-            col = next((c for c in self.sheet.columns if c.name == old_name), None)
+            col = self._col_by_name.get(old_name)
             if col is None:
                 raise ValueError(f"Column '{old_name}' not found")
             
             # Update the column name
             col.name = new_name
+            self._columns_version += 1
+            self._index_columns()
+            if old_name in self._columns:
+                self._columns[new_name] = self._columns.pop(old_name)
+            if old_name in self._lowered:
+                self._lowered[new_name] = self._lowered.pop(old_name)
+            self._searches.clear()
             
             # Clear caches to force refresh
             self._stats_cache.clear()
-            self._sample_rows = None
+            self._freq_cache.clear()
+
+            # Cell values are unchanged, so serialized pages carry over to
+            # the new view with the new header; only their JSON is redone
+            pages = self._view.cached_pages()
+            self._publish()
+            header = [c.name for c in self.sheet.columns]
+            for key, page in pages:
+                if isinstance(page, dict):
+                    self._view.cache_page(key, {**page, "header": header})
+            self._sample_index = None
 
     def get_state(self) -> dict[str, Any]:
         """
@@ -586,17 +880,45 @@ class DatasetHandle:
         Returns:
             Dictionary with 'sort' and 'filter' state
         """
-        with self._lock:
-            return {
-                "sort": {
-                    "column": self._current_sort[0] if self._current_sort else None,
-                    "ascending": self._current_sort[1] if self._current_sort else None,
-                } if self._current_sort else None,
-                "filter": {
-                    "column": self._current_filter[0] if self._current_filter else None,
-                    "term": self._current_filter[1] if self._current_filter else None,
-                } if self._current_filter else None,
-            }
+        return _view_state(self._view)
+
+    def get_rows_json_and_total(self, start: int = 0, limit: int = 50) -> tuple[str, int]:
+        """
+        Return (get_rows_json(), row count) from one view snapshot, so a
+        sort or filter landing in between cannot pair one view's rows with
+        another's count.
+        """
+        view = self._view
+        return self._rows_json(view, start, limit), len(view)
+
+    def get_state_and_rows_json(self, start: int = 0, limit: int = 50) -> tuple[str, int, str]:
+        """
+        Return (state JSON, row count, get_rows_json()) from one view snapshot.
+
+        Lets the API layer report a sort/filter and send its first page
+        without another writer's change landing in between.
+        """
+        view = self._view
+        state = view.cached_page(("state",))
+        if state is None:
+            state = encode_json(_view_state(view)).decode()
+            view.cache_page(("state",), state)
+        return state, len(view), self._rows_json(view, start, limit)
+
+    def cached_column_frequency(self, col_name: str, limit: int = 20) -> list[dict[str, Any]] | None:
+        """
+        get_column_frequency() from the cache alone, or None if the column
+        would have to be scanned. Never takes the lock.
+        """
+        cached = self._freq_cache.get(col_name)
+        return None if cached is None else _top_frequencies(cached, limit)
+
+    def cached_column_stats(self, col_name: str) -> dict[str, Any] | None:
+        """
+        get_column_stats_sample() from the cache alone, or None if the
+        column would have to be scanned. Never takes the lock.
+        """
+        return self._stats_cache.get(col_name)
 
     def get_column_frequency(self, col_name: str, limit: int = 20) -> list[dict[str, Any]]:
         """
@@ -605,147 +927,119 @@ class DatasetHandle:
         """
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"Starting frequency analysis for column: {col_name}")
-
-        with self._lock:
-            col = next((c for c in self.sheet.columns if c.name == col_name), None)
-            if col is None:
-                raise ValueError(f"Column '{col_name}' not found")
+        logger.info("Starting frequency analysis for column: %s", col_name)
+
+        # The full ranking is cached per column: sorting doesn't change
+        # it, so only filters and schema changes drop it. A cached ranking
+        # is used without waiting for a writer.
+        cached = self._freq_cache.get(col_name)
+        if cached is None:
+            with self._lock:
+                col = self._col_by_name.get(col_name)
+                if col is None:
+                    raise ValueError(f"Column '{col_name}' not found")
 
-            # Use Counter to count values
-            counter = collections.Counter()
-            
-            # Optimization: Fast path for list-based rows
-            if hasattr(col, 'expr') and isinstance(col.expr, int) and self.sheet.rows and isinstance(self.sheet.rows[0], list):
-                logger.info("Using fast path for frequency analysis")
-                idx = col.expr
-                for row in self.sheet.rows:
-                    try:
-                        val = row[idx]
-                        # Handle None/NaN
-                        if val is None:
-                            val = "(empty)"
-                        elif isinstance(val, float) and math.isnan(val):
-                            val = "(empty)"
-                        
-                        # Ensure value is hashable
-                        if not isinstance(val, (str, int, float, bool, bytes)):
-                            val = str(val)
-                            
-                        counter[val] += 1
-                    except (IndexError, TypeError):
-                        pass
-            else:
-                logger.info("Using slow path for frequency analysis")
-                # Slow path
-                for row in self.sheet.rows:
+                cached = self._freq_cache.get(col_name)
+                if cached is None:
+                    # Count raw values with Counter's C loop, then normalize the
+                    # (much smaller) set of distinct values
+                    values = self._visible_values(col)
                     try:
-                        val = col.getValue(row)
-                        if val is None:
-                            val = "(empty)"
-                        elif isinstance(val, float) and math.isnan(val):
-                            val = "(empty)"
-                            
-                        # Ensure value is hashable
-                        if not isinstance(val, (str, int, float, bool, bytes)):
-                            val = str(val)
-                            
-                        counter[val] += 1
-                    except Exception:
-                        pass
-
-            total_count = sum(counter.values())
-            logger.info(f"Analysis complete. Total count: {total_count}")
-            
-            if total_count == 0:
-                return []
+                        raw_counts = collections.Counter(values)
+                    except TypeError:
+                        # Unhashable cells: normalize before counting
+                        raw_counts = collections.Counter(map(_frequency_key, values))
 
-            # Get top N
-            most_common = counter.most_common(limit)
-            
-            result = []
-            for val, count in most_common:
-                percent = (count / total_count) * 100
-                result.append({
-                    "name": str(val), # Ensure name is string for UI
-                    "count": count,
-                    "percent": round(percent, 2)
-                })
-                
-            return result
+                    counter = collections.Counter()
+                    for val, count in raw_counts.items():
+                        counter[_frequency_key(val)] += count
 
-    def _get_sample(self, size: int) -> list[Any]:
-        """Get a random sample of rows, cached per sheet state."""
-        if self._sample_rows is not None:
-            return self._sample_rows
-            
-        total_rows = len(self.sheet.rows)
-        if total_rows <= size:
-            self._sample_rows = self.sheet.rows
+                    cached = (counter.most_common(), sum(counter.values()))
+                    self._freq_cache[col_name] = cached
+
+        logger.info("Analysis complete. Total count: %s", cached[1])
+        return _top_frequencies(cached, limit)
+
+    def _get_sample(self, size: int) -> Sequence[int]:
+        """
+        Load-order positions of a random sample of the visible rows,
+        cached per sheet state.
+        """
+        if self._sample_index is not None:
+            return self._sample_index
+
+        if self._row_index is not None:
+            visible = self._row_index
         else:
-            # Use random.sample for uniform random sampling without replacement
-            self._sample_rows = random.sample(self.sheet.rows, size)
-            
-        return self._sample_rows
+            visible = range(len(self._base_rows()))
+        if len(visible) > size:
+            # Sample positions rather than rows; values are gathered per column
+            visible = random.sample(visible, size)
+        self._sample_index = visible
+        return self._sample_index
+
+    def _sample_values(self, col: Any, size: int) -> list[Any]:
+        """Raw values of the column for the sampled rows."""
+        positions = self._get_sample(size)
+        values = self._column_values(col)
+        if len(positions) == len(values):
+            return values  # Every row is in the sample; order doesn't matter
+        return list(map(values.__getitem__, positions))
 
     def get_column_stats_sample(self, col_name: str, sample_size: int = 10000) -> dict[str, Any]:
         """
         Calculate quick statistics for a column using sampling.
         Optimized for performance (< 50ms).
         """
+        # A cached result is returned without waiting for a writer
+        stats = self._stats_cache.get(col_name)
+        if stats is not None:
+            return stats
+
         with self._lock:
-            # Check cache first
+            # Check cache again: another reader may have just filled it
             if col_name in self._stats_cache:
                 return self._stats_cache[col_name]
 
-            col = next((c for c in self.sheet.columns if c.name == col_name), None)
+            col = self._col_by_name.get(col_name)
             if col is None:
                 raise ValueError(f"Column '{col_name}' not found")
 
-            # Determine rows to scan using cached random sample
-            total_rows = len(self.sheet.rows)
-            rows_to_scan = self._get_sample(sample_size)
-            is_sample = total_rows > len(rows_to_scan)
-            scanned_count = len(rows_to_scan)
-            
-            null_count = 0
-            unique_set = set()
-            numeric_values = []
+            # Determine values to scan using cached random sample
+            total_rows = self.row_count
+            values = self._sample_values(col, sample_size)
+            is_sample = total_rows > len(values)
+            scanned_count = len(values)
             
-            # Optimization: Fast path for list-based rows
-            if hasattr(col, 'expr') and isinstance(col.expr, int) and self.sheet.rows and isinstance(self.sheet.rows[0], list):
-                idx = col.expr
-                for row in rows_to_scan:
-                    try:
-                        val = row[idx]
-                        if val is None or val == "":
-                            null_count += 1
-                        else:
-                            # Use set for uniqueness (no truncation to preserve accuracy)
-                            # We convert to string to ensure hashability for mixed types
-                            unique_set.add(str(val))
-                            
-                            if isinstance(val, (int, float)) and not (isinstance(val, float) and math.isnan(val)):
-                                numeric_values.append(val)
-                    except IndexError:
-                        null_count += 1
+            # Each statistic is a single C-level pass over the sampled values
+            null_count = values.count(None) + values.count("")
+            if null_count:
+                present = [val for val in values if val is not None and val != ""]
             else:
-                # Slow path
-                for row in rows_to_scan:
-                    try:
-                        val = col.getValue(row)
-                        if val is None or val == "":
-                            null_count += 1
-                        else:
-                            unique_set.add(str(val))
-                            
-                            if isinstance(val, (int, float)) and not (isinstance(val, float) and math.isnan(val)):
-                                numeric_values.append(val)
-                    except Exception:
-                        null_count += 1
+                present = values
+
+            # Use set for uniqueness (no truncation to preserve accuracy)
+            # We convert to string to ensure hashability for mixed types;
+            # for all-str or all-int columns the values already compare
+            # exactly like their strings
+            kinds = set(map(type, present))
+            if len(kinds) == 1 and (str in kinds or int in kinds):
+                unique_count = len(set(present))
+            else:
+                unique_count = len(set(map(str, present)))
+
+            if kinds <= _NUMERIC_TYPES:
+                # Plain numbers: only NaN (the one value not equal to itself) is dropped
+                numeric_values = [val for val in present if val == val] if float in kinds else present
+                is_float = float in set(map(type, numeric_values))
+            else:
+                numeric_values = [
+                    val for val in present
+                    if isinstance(val, (int, float)) and not (isinstance(val, float) and math.isnan(val))
+                ]
+                is_float = any(isinstance(x, float) for x in numeric_values)
 
             # Calculate stats
-            unique_count = len(unique_set)
             null_percent = round((null_count / scanned_count) * 100, 1) if scanned_count > 0 else 0
             
             stats = {
@@ -763,13 +1057,112 @@ class DatasetHandle:
                 stats["min"] = min(numeric_values)
                 stats["max"] = max(numeric_values)
                 stats["mean"] = round(sum(numeric_values) / len(numeric_values), 2)
-                stats["type"] = "float" if any(isinstance(x, float) for x in numeric_values) else "integer"
+                stats["type"] = "float" if is_float else "integer"
             
             # Cache the result
             self._stats_cache[col_name] = stats
             return stats
 
 
+def _top_frequencies(cached: tuple[list[tuple[Any, int]], int], limit: int) -> list[dict[str, Any]]:
+    """Format the top `limit` entries of a cached (ranking, total) pair."""
+    ranked, total_count = cached
+    if total_count == 0:
+        return []
+
+    # Get top N
+    most_common = ranked[:limit]
+
+    result = []
+    for val, count in most_common:
+        percent = (count / total_count) * 100
+        result.append({
+            "name": str(val), # Ensure name is string for UI
+            "count": count,
+            "percent": round(percent, 2)
+        })
+
+    return result
+
+
+def _extract_column(col: Any, rows: list[Any], idx: int | None) -> list[Any]:
+    """
+    Pull one column's raw values out of a list of rows.
+
+    idx is the cell index for list-based rows (CSV), or None to go
+    through the column's getter.
+    """
+    if idx is not None:
+        try:
+            return [row[idx] for row in rows]
+        except IndexError:
+            pass  # Ragged rows: let the getter fill missing cells with None
+    return [_get_value_safe(col, row) for row in rows]
+
+
+def _cell_index(col: Any) -> int | None:
+    """Index of the column's cell in list rows (ItemColumn.expr), or None."""
+    expr = getattr(col, 'expr', None)
+    return expr if isinstance(expr, int) else None
+
+
+def _get_value_safe(col: Any, row: Any) -> Any:
+    """Return col.getValue(row), or None if VisiData raises."""
+    try:
+        return col.getValue(row)
+    except Exception:
+        return None
+
+
+def _select_matching(indices: Iterable[int], values: list[Any], match: Callable[[Any], bool]) -> list[int]:
+    """Return the indices whose value satisfies match; errors count as no match."""
+    try:
+        return [i for i in indices if match(values[i])]
+    except Exception:
+        selected = []
+        for i in indices:
+            try:
+                if match(values[i]):
+                    selected.append(i)
+            except Exception:
+                continue
+        return selected
+
+
+def _typed_sort_value(col: Any, row: Any) -> Any:
+    """
+    Sort value for a row based on the column's typed value.
+
+    Numbers are returned as-is; values that failed type conversion are
+    compared as strings. Returns None for missing values.
+    """
+    try:
+        val = col.getTypedValue(row)
+        if val is None:
+            return None
+        if isinstance(val, (int, float)):
+            return val
+        # Failed conversion or other type
+        return str(val)
+    except Exception:
+        # Fallback to display value for comparison
+        return col.getDisplayValue(row)
+
+
+def _frequency_key(val: Any) -> Any:
+    """Normalize a cell value into a hashable frequency bucket."""
+    # Handle None/NaN
+    if val is None:
+        return "(empty)"
+    if isinstance(val, float) and math.isnan(val):
+        return "(empty)"
+
+    # Ensure value is hashable
+    if not isinstance(val, (str, int, float, bool, bytes)):
+        return str(val)
+    return val
+
+
 def _get_type_name(vd_type: Any) -> str:
     """Map VisiData type objects to string names."""
     if vd_type is None:
@@ -797,32 +1190,114 @@ def _get_type_name(vd_type: Any) -> str:
         return type_name if type_name else "string"
 
 
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode a JSON-safe object (e.g. an API payload) with orjson.
+
+    orjson rejects integers beyond 64 bits, which typed columns can hold;
+    such payloads fall back to the stdlib encoder.
+    """
+    try:
+        return orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _serialize_column(col: Any, rows: list[Any], list_rows: bool) -> list[Any]:
+    """
+    Serialize one column's values for a page of rows.
+
+    The reader is picked once per column: list rows are read by index,
+    untyped (anytype) columns through getValue, since getTypedValue would
+    return the same value, int/float/str columns by converting the raw
+    values directly, and other columns through getTypedValue. A column
+    whose cells are all JSON-safe primitives is then returned without
+    per-value conversion.
+    """
+    idx = _cell_index(col) if list_rows else None
+    try:
+        if idx is not None:
+            values = [row[idx] for row in rows]
+        elif col.type is _vd().anytype:
+            values = list(map(col.getValue, rows))
+        else:
+            values = None
+            if col.type in (int, float, str):
+                values = _convert_plain_values(col, rows)
+            if values is None:
+                values = list(map(col.getTypedValue, rows))
+    except Exception:
+        pass  # Ragged rows or getter errors: fall back to the per-cell path
+    else:
+        kinds = set(map(type, values)) - _JSON_SAFE_TYPES
+        if not kinds:
+            return values
+        if kinds == {float}:
+            # Only NaN/Infinity need converting
+            isfinite = math.isfinite
+            return [
+                v if type(v) is not float or isfinite(v) else _serialize_float(v)
+                for v in values
+            ]
+        try:
+            return list(map(_serialize_value, values))
+        except Exception:
+            pass
+
+    values = []
+    for row in rows:
+        try:
+            value = row[idx] if idx is not None else col.getTypedValue(row)
+            values.append(_serialize_value(value))
+        except Exception:
+            values.append(col.getDisplayValue(row))
+    return values
+
+
+def _convert_plain_values(col: Any, rows: list[Any]) -> list[Any] | None:
+    """
+    Typed values of an int/float/str column, without getTypedValue.
+
+    Converts the raw values with the column type, as getTypedValue does
+    but without its per-cell wrapper. Returns None when a raw value is
+    not a plain scalar or fails to convert, since the wrapper's handling
+    would differ.
+    """
+    values = list(map(col.getValue, rows))
+    if set(map(type, values)) - _JSON_SAFE_TYPES - {float}:
+        return None
+    convert = col.type
+    try:
+        return [None if v is None else convert(v) for v in values]
+    except (ValueError, TypeError):
+        return None
+
+
 def _serialize_value(value: Any) -> Any:
     """
     Convert a value to a JSON-serializable type.
 
-    Handles common non-serializable types from VisiData.
+    Handles common non-serializable types from VisiData. Exact builtin
+    types are dispatched with one lookup on type(value); subclasses and
+    other objects go through the isinstance checks below.
     """
-    if value is None:
-        return None
+    kind = type(value)
+    if kind in _JSON_SAFE_TYPES:
+        return value
+    serialize = _SERIALIZERS.get(kind)
+    if serialize is not None:
+        return serialize(value)
 
     # Already serializable primitives
     if isinstance(value, (str, int, bool)):
         return value
 
     if isinstance(value, float):
-        if math.isnan(value):
-            return "NaN"
-        if math.isinf(value):
-            return "Infinity" if value > 0 else "-Infinity"
-        return value
+        return _serialize_float(value)
 
     # Handle bytes
     if isinstance(value, bytes):
-        try:
-            return value.decode('utf-8')
-        except UnicodeDecodeError:
-            return value.hex()
+        return _serialize_bytes(value)
 
     # Handle datetime objects
     if hasattr(value, 'isoformat'):
@@ -836,6 +1311,30 @@ def _serialize_value(value: Any) -> Any:
     return str(value)
 
 
+def _serialize_float(value: float) -> float | str:
+    """Spell out NaN and infinities, which JSON cannot represent."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+
+def _serialize_bytes(value: bytes) -> str:
+    """Decode bytes as UTF-8, falling back to hex."""
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return value.hex()
+
+
+# Serializers for exact builtin types that are not already JSON-safe
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    float: _serialize_float,
+    bytes: _serialize_bytes,
+}
+
+
 def load_dataset(path: str) -> DatasetHandle:
     """
     Load a dataset from the given path using VisiData's loaders.
@@ -863,15 +1362,18 @@ def load_dataset(path: str) -> DatasetHandle:
         raise FileNotFoundError(f"File not found: {path}")
 
     # Initialize VisiData in non-interactive mode
-    vd = visidata.vd
+    vd = _vd().vd
 
     # Use VisiData's openSource to get the appropriate sheet type
-    vd_path = visidata.Path(str(filepath))
+    vd_path = _vd().Path(str(filepath))
     sheet = vd.openSource(vd_path)
 
     # VisiData's reload() is async by default. For synchronous loading,
     # we directly call iterload() and materialize the rows.
-    if hasattr(sheet, 'iterload'):
+    rows = _read_csv_rows(sheet, filepath)
+    if rows is not None:
+        sheet.rows = rows
+    elif hasattr(sheet, 'iterload'):
         sheet.rows = list(sheet.iterload())
 
     # Handle CSV/TSV: first row is header, create columns from it
@@ -881,9 +1383,10 @@ def load_dataset(path: str) -> DatasetHandle:
         if isinstance(first_row, (list, tuple)):
             # First row is the header - use it for column names
             for i, col_name in enumerate(first_row):
-                sheet.addColumn(visidata.ColumnItem(str(col_name), i))
-            # Remove header row from data
-            sheet.rows = sheet.rows[1:]
+                sheet.addColumn(_vd().ColumnItem(str(col_name), i))
+            # Remove header row from data, in place rather than by copying
+            # every other row into a new list
+            del sheet.rows[0]
 
     # Infer column types to ensure correct sorting (e.g. numeric vs string)
     _infer_column_types(sheet)
@@ -894,6 +1397,36 @@ def load_dataset(path: str) -> DatasetHandle:
     )
 
 
+def _read_csv_rows(sheet: Any, filepath: Path) -> list[list[str]] | None:
+    """
+    Read a plain .csv file straight through the csv module.
+
+    Produces the same rows as CsvSheet.iterload() (same csv_* options,
+    blank lines skipped) without its per-line progress tracking and
+    generator overhead. Returns None when VisiData's own loader is
+    needed: other formats, compressed files, regex_skip/safety_first,
+    or a row the csv module rejects.
+    """
+    if not isinstance(sheet, _vd().CsvSheet) or filepath.suffix.lower() != '.csv':
+        return None
+    if sheet.options.regex_skip or sheet.options.safety_first:
+        return None
+
+    # Same option handling as CsvSheet.iterload()
+    csv_opts = sheet.source.options.getall('csv_')
+    if sheet.source.options.delimiter != sheet.source.options.getdefault('delimiter'):
+        if csv_opts['delimiter'] == sheet.source.options.getdefault('csv_delimiter'):
+            csv_opts['delimiter'] = sheet.source.options.delimiter
+
+    csv.field_size_limit(2**31-1)
+    try:
+        with open(filepath, encoding=sheet.options.encoding,
+                  errors=sheet.options.encoding_errors, newline='') as fp:
+            return [row for row in csv.reader(fp, **csv_opts) if row]
+    except csv.Error:
+        return None
+
+
 def _infer_column_types(sheet: Any, sample_size: int = 1000) -> None:
     """
     Infer column types by sampling data.
@@ -906,7 +1439,9 @@ def _infer_column_types(sheet: Any, sample_size: int = 1000) -> None:
     if total_rows <= sample_size:
         rows_to_sample = sheet.rows
     else:
-        rows_to_sample = random.sample(sheet.rows, sample_size)
+        positions = random.sample(range(total_rows), sample_size)
+        rows_to_sample = list(map(sheet.rows.__getitem__, positions))
+    list_rows = bool(rows_to_sample) and isinstance(rows_to_sample[0], list)
 
     for col in sheet.columns:
         # Skip if type is already set to something specific (not anytype)
@@ -914,42 +1449,83 @@ def _infer_column_types(sheet: Any, sample_size: int = 1000) -> None:
         if type_name not in ('anytype', 'str', 'string', ''):
              continue
 
-        # Get sample values (skip empty/None)
-        values = []
-        for row in rows_to_sample:
-            try:
-                val = col.getValue(row)
-                if val is not None and val != '':
-                    values.append(val)
-            except Exception:
-                pass
-        
+        # Get sample values (skip empty/None); list rows are read by index
+        raw = _extract_column(col, rows_to_sample, _cell_index(col) if list_rows else None)
+        values = [val for val in raw if val is not None and val != '']
+
         if not values:
             continue
-            
-        # Helper to check type consistency
-        def check_type(type_func, threshold=0.8):
-            valid_count = 0
-            for v in values:
-                try:
-                    type_func(v)
-                    valid_count += 1
-                except ValueError:
-                    pass
-            return valid_count / len(values) >= threshold
 
         # Try int first
-        if check_type(int):
+        if _mostly_converts(int, values):
             col.type = int
             _convert_column_data(col, sheet.rows)
             continue
 
         # Try float
-        if check_type(float):
+        if _mostly_converts(float, values):
             col.type = float
             _convert_column_data(col, sheet.rows)
             continue
 
+        # Low-cardinality text (categories, statuses): let equal cells
+        # share one string object
+        if all(type(v) is str for v in values) and len(set(values)) <= len(values) * _REPEATED_TEXT_RATIO:
+            _share_repeated_strings(col, sheet.rows)
+
+
+def _mostly_converts(type_func: Callable[[Any], Any], values: list[Any], threshold: float = 0.8) -> bool:
+    """Whether at least `threshold` of the values convert with type_func."""
+    try:
+        # Common case: every value converts, checked in one C-level pass
+        collections.deque(map(type_func, values), maxlen=0)
+        return True
+    except (ValueError, TypeError):
+        pass
+    valid_count = 0
+    for v in values:
+        try:
+            type_func(v)
+            valid_count += 1
+        except (ValueError, TypeError):
+            pass
+    return valid_count / len(values) >= threshold
+
+
+def _share_repeated_strings(col: Any, rows: list[Any]) -> None:
+    """
+    Replace each text cell of a column with one canonical object per value.
+
+    Frees the duplicate strings the CSV reader creates for every cell and
+    lets hashing and equality on the column hit the identity fast path.
+    """
+    idx = _cell_index(col)
+    if idx is None or not rows or not isinstance(rows[0], list):
+        return
+
+    canonical: dict[str, str] = {}
+    for row in rows:
+        try:
+            val = row[idx]
+        except IndexError:
+            continue
+        if type(val) is str:
+            row[idx] = canonical.setdefault(val, val)
+
+
+def _view_state(view: _View) -> dict[str, Any]:
+    """The sort and filter state of a view, as sent to API clients."""
+    return {
+        "sort": {
+            "column": view.sort[0],
+            "ascending": view.sort[1],
+        } if view.sort else None,
+        "filter": {
+            "column": view.filter[0],
+            "term": view.filter[1],
+        } if view.filter else None,
+    }
+
 
 def _convert_column_data(col: Any, rows: list[Any]) -> None:
     """
@@ -958,8 +1534,8 @@ def _convert_column_data(col: Any, rows: list[Any]) -> None:
     """
     # Optimization: Fast path for standard list-based rows (like CSV)
     # col.expr holds the index for ItemColumn in VisiData
-    if hasattr(col, 'expr') and isinstance(col.expr, int) and rows and isinstance(rows[0], list):
-        idx = col.expr
+    idx = _cell_index(col)
+    if idx is not None and rows and isinstance(rows[0], list):
         type_func = col.type
         
         for row in rows:
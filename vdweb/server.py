@@ -7,21 +7,26 @@ FastAPI application serving both the WebSocket API and the static frontend.
 from __future__ import annotations
 
 import asyncio
-import json
+import collections
+import functools
 import logging
 import os
 import uuid
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from .core import (
     DatasetHandle,
+    encode_json,
     get_current_dataset,
     load_dataset,
     set_current_dataset,
@@ -35,9 +40,46 @@ _initial_dataset_path: str | None = None
 # Unique session ID for this server instance to detect restarts
 SERVER_SESSION_ID = str(uuid.uuid4())
 
+# Fixed messages, encoded once: the hello sent on connect and the
+# keep-alive reply
+_SERVER_RESTART = encode_json({
+    "action": "server_restart",
+    "success": True,
+    "data": {"session_id": SERVER_SESSION_ID, "message": "Server ready"},
+}).decode()
+_PONG = '{"action":"pong","success":true}'
+# Body of the "/" fallback served when the frontend has not been built
+_STATIC_MISSING = encode_json({
+    "error": "Frontend not built",
+    "message": "Run 'npm run build' in the frontend directory and copy dist/* to vdweb/static/",
+})
+
 # Constants
 MAX_FILE_SIZE_BYTES = 100 * 1024 * 1024  # 100MB
 OPERATION_TIMEOUT_SEC = 5.0
+MAX_CONCURRENT_STATS = 8  # per connection: stats threads running, and requests kept (older ones are dropped)
+# Origins of the Vite dev server, allowed cross-origin HTTP access
+DEV_ORIGINS = ["http://localhost:5173", "http://127.0.0.1:5173"]
+# Larger get_rows pages are sent as several "rows" messages of this size
+ROWS_CHUNK_SIZE = 1000
+
+
+class _FrontendStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets browsers cache the built frontend.
+
+    Vite emits content-hashed file names under assets/, so those are
+    marked immutable; everything else (index.html, icons) is revalidated
+    against its ETag on each load, so a new build is picked up.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if Path(full_path).parent.name == "assets":
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
 
 
 def set_initial_dataset_path(path: str) -> None:
@@ -133,23 +175,119 @@ def _get_dataset_or_none() -> DatasetHandle | None:
     return get_current_dataset()
 
 
+@functools.lru_cache(maxsize=256)
+def _error_frame(action: str, message: str) -> str:
+    """An encoded error response; a repeated error is encoded once."""
+    return f'{{"action":"{action}","success":false,"error":{encode_json(message).decode()}}}'
+
+
+class _LoadRejected(Exception):
+    """A file refused before loading; the message is sent to the client as is."""
+
+
+def _load_within_limit(path: str) -> DatasetHandle:
+    """Check the file's size against MAX_FILE_SIZE_BYTES, then load it."""
+    try:
+        size = os.path.getsize(path)
+    except OSError as e:
+        raise _LoadRejected(f"Could not access file: {e}") from e
+    if size > MAX_FILE_SIZE_BYTES:
+        raise _LoadRejected(
+            f"File too large ({size / 1024 / 1024:.1f}MB). Limit is {MAX_FILE_SIZE_BYTES / 1024 / 1024:.0f}MB."
+        )
+    return load_dataset(path)
+
+
 # --- WebSocket Handler ---
 
+@dataclass(frozen=True)
+class Cmd:
+    """A WebSocket command: its handler and the parameters it requires."""
+    fn: Callable[[WebSocketHandler, dict], Awaitable[None]]
+    required: tuple[str, ...] = ()
+    err_action: str = "error"
+    missing_message: str | None = None  # sent instead of the generated one
+    ints: tuple[str, ...] = ()  # optional parameters that must be integers
+
+    @property
+    def missing_error(self) -> str:
+        if self.missing_message is not None:
+            return self.missing_message
+        names = " or ".join(f"'{key}'" for key in self.required)
+        return f"Missing {names} parameter"
+
+
 class WebSocketHandler:
     """
     Handles WebSocket commands for real-time data exploration.
 
     Protocol:
     - Client sends: {"action": "get_rows", "start": 0, "limit": 50}
+      (add "format": "columnar" for one value list per column)
     - Server sends: {"action": "rows", "success": true, "data": {...}}
     """
 
+    __slots__ = ("websocket", "active_stats_tasks", "stats_slots", "filter_task", "pending_filter")
+
     def __init__(self, websocket: WebSocket):
         self.websocket = websocket
-        self.active_stats_tasks: dict[str, asyncio.Task] = {}
+        # column -> (task, req_id) of stats requests not yet answered
+        self.active_stats_tasks: collections.OrderedDict[str, tuple[asyncio.Task, int | None]] = collections.OrderedDict()
+        # Held from the start of a stats thread until it returns, even if
+        # the request waiting on it was dropped or timed out
+        self.stats_slots = asyncio.Semaphore(MAX_CONCURRENT_STATS)
+        # Filter commands run in the background, one at a time; while one
+        # runs, only the most recent filter sent after it is kept
+        self.filter_task: asyncio.Task | None = None
+        self.pending_filter: Callable[[], Awaitable[None]] | None = None
+
+    def queue_filter(self, run: Callable[[], Awaitable[None]]):
+        """
+        Run a filter command in the background, latest wins.
+
+        While a filter is running, a new one replaces any filter still
+        waiting behind it, so a burst of keystrokes only applies the
+        first and the last filter.
+        """
+        if self.filter_task is not None:
+            self.pending_filter = run
+            return
+        self.filter_task = asyncio.create_task(self._run_filters(run))
+
+    async def _run_filters(self, run: Callable[[], Awaitable[None]] | None):
+        """Run a filter, then whichever filter was queued behind it, until none is left."""
+        try:
+            while run is not None:
+                try:
+                    await run()
+                except Exception as e:
+                    logger.error("Filter task failed: %s", e)
+                run, self.pending_filter = self.pending_filter, None
+        finally:
+            self.filter_task = None
+
+    async def wait_for_filters(self):
+        """Wait for queued filters, so a later command sees their result."""
+        if self.filter_task is not None:
+            await self.filter_task
+
+    async def send_data(self, action: str, data_json: str):
+        """
+        Send a successful response whose data is already encoded as JSON.
+
+        The envelope is constant-shape, so it is written around data_json
+        directly. Frames stay text: the frontend parses every message with
+        JSON.parse(event.data).
+        """
+        await self.websocket.send_text(
+            f'{{"action":"{action}","success":true,"data":{data_json}}}'
+        )
 
     async def send_response(self, action: str, data: Any = None, success: bool = True, error: str | None = None):
         """Send a JSON response to the client."""
+        if success and data is not None and error is None:
+            await self.send_data(action, encode_json(data).decode())
+            return
         response = {
             "action": action,
             "success": success,
@@ -158,11 +296,57 @@ class WebSocketHandler:
             response["data"] = data
         if error is not None:
             response["error"] = error
-        await self.websocket.send_json(response)
+        await self.websocket.send_text(encode_json(response).decode())
 
     async def send_error(self, message: str, action: str = "error"):
         """Send an error response."""
-        await self.send_response(action, success=False, error=message)
+        await self.websocket.send_text(_error_frame(action, message))
+
+    async def send_columns(self, dataset: DatasetHandle):
+        """Send the column list, splicing in the dataset's cached column JSON."""
+        await self.send_data(
+            "columns",
+            f'{{"columns":{dataset.get_columns_json()},"count":{dataset.column_count}}}',
+        )
+
+    async def send_info(self, action: str, dataset: DatasetHandle):
+        """Send the dataset info, splicing in the cached column JSON."""
+        # Only the path and counts are encoded per call
+        await self.send_data(
+            action,
+            f'{{"path":{encode_json(dataset.path).decode()},'
+            f'"row_count":{dataset.row_count},"column_count":{dataset.column_count},'
+            f'"columns":{dataset.get_columns_json()}}}',
+        )
+
+    async def send_view(self, action: str, dataset: DatasetHandle):
+        """
+        Send the new sort/filter state, then the first page of rows.
+
+        Both come from one snapshot of the view, fetched and encoded in a
+        single worker-thread call.
+        """
+        state_json, total, page_json = await asyncio.to_thread(
+            dataset.get_state_and_rows_json, 0, 100
+        )
+        await self.send_data(action, f'{{"success":true,"state":{state_json},"total":{total}}}')
+        await self.send_data(
+            "rows",
+            f'{{"start":0,"limit":100,"total":{total},"reset":true,{page_json[1:]}',
+        )
+
+    async def send_first_page(self, dataset: DatasetHandle):
+        """
+        Send the first page of rows after the view changed.
+
+        "reset": true tells the frontend to clear its row cache. The page
+        is built and encoded in a worker thread, off the event loop.
+        """
+        page_json, total = await asyncio.to_thread(dataset.get_rows_json_and_total, 0, 100)
+        await self.send_data(
+            "rows",
+            f'{{"start":0,"limit":100,"total":{total},"reset":true,{page_json[1:]}',
+        )
 
     async def handle_get_columns(self):
         """Handle get_columns command."""
@@ -171,17 +355,14 @@ class WebSocketHandler:
             await self.send_error("No dataset loaded", action="columns")
             return
 
-        columns = [
-            {"name": c.name, "type": c.type, "width": c.width}
-            for c in dataset.get_columns()
-        ]
-        await self.send_response("columns", {
-            "columns": columns,
-            "count": len(columns)
-        })
-
-    async def handle_get_rows(self, start: int = 0, limit: int = 50):
-        """Handle get_rows command."""
+        await self.send_columns(dataset)
+
+    async def handle_get_rows(self, start: int = 0, limit: int = 50, columnar: bool = False):
+        """
+        Handle get_rows command.
+
+        columnar=True sends {header, columns} instead of {header, rows}.
+        """
         dataset = _get_dataset_or_none()
         if dataset is None:
             await self.send_error("No dataset loaded", action="rows")
@@ -191,14 +372,21 @@ class WebSocketHandler:
         start = max(0, start)
         limit = min(max(1, limit), 10000)
 
-        result = dataset.get_rows(start=start, limit=limit)
-        await self.send_response("rows", {
-            "header": result["header"],
-            "rows": result["rows"],
-            "start": start,
-            "limit": limit,
-            "total": dataset.row_count
-        })
+        # Large pages go out in chunks, so the first rows are on the wire
+        # before the rest are encoded. The client places each "rows"
+        # message by its start, so the chunks need no extra framing.
+        # All chunks come from one view, so a sort or filter landing
+        # mid-stream cannot mix totals or rows of two views. Each chunk is
+        # built and encoded in a worker thread, off the event loop.
+        extra = '"format":"columnar",' if columnar else ''
+        total, pages = dataset.get_rows_json_chunks(start, limit, ROWS_CHUNK_SIZE, columnar)
+        while (page := await asyncio.to_thread(next, pages, None)) is not None:
+            chunk_start, chunk, page_json = page
+            # The page comes back already encoded; splice it into the envelope
+            await self.send_data(
+                "rows",
+                f'{{"start":{chunk_start},"limit":{chunk},"total":{total},{extra}{page_json[1:]}',
+            )
 
     async def handle_get_info(self):
         """Handle get_info command."""
@@ -207,50 +395,25 @@ class WebSocketHandler:
             await self.send_error("No dataset loaded", action="info")
             return
 
-        columns = [
-            {"name": c.name, "type": c.type, "width": c.width}
-            for c in dataset.get_columns()
-        ]
-        await self.send_response("info", {
-            "path": dataset.path,
-            "row_count": dataset.row_count,
-            "column_count": dataset.column_count,
-            "columns": columns
-        })
+        await self.send_info("info", dataset)
 
     async def handle_load(self, path: str):
         """Handle load command to load a new dataset."""
-        # Check file size
         try:
-            size = os.path.getsize(path)
-            if size > MAX_FILE_SIZE_BYTES:
-                await self.send_error(
-                    f"File too large ({size / 1024 / 1024:.1f}MB). Limit is {MAX_FILE_SIZE_BYTES / 1024 / 1024:.0f}MB.",
-                    action="loaded"
+            # Loads from different clients run one at a time, so the last
+            # one requested is the one left current. Size check and load
+            # share one worker thread, so a slow filesystem never stalls
+            # the event loop; wrap both in timeout
+            async with self.websocket.app.state.load_lock:
+                dataset = await asyncio.wait_for(
+                    asyncio.to_thread(_load_within_limit, path),
+                    timeout=OPERATION_TIMEOUT_SEC
                 )
-                return
-        except OSError as e:
-             await self.send_error(f"Could not access file: {e}", action="loaded")
-             return
+                set_current_dataset(dataset)
 
-        try:
-            # Wrap load in timeout
-            dataset = await asyncio.wait_for(
-                asyncio.to_thread(load_dataset, path),
-                timeout=OPERATION_TIMEOUT_SEC
-            )
-            set_current_dataset(dataset)
-
-            columns = [
-                {"name": c.name, "type": c.type, "width": c.width}
-                for c in dataset.get_columns()
-            ]
-            await self.send_response("loaded", {
-                "path": dataset.path,
-                "row_count": dataset.row_count,
-                "column_count": dataset.column_count,
-                "columns": columns
-            })
+            await self.send_info("loaded", dataset)
+        except _LoadRejected as e:
+            await self.send_error(str(e), action="loaded")
         except asyncio.TimeoutError:
             await self.send_error("Loading timed out.", action="loaded")
         except FileNotFoundError:
@@ -272,22 +435,7 @@ class WebSocketHandler:
                 timeout=OPERATION_TIMEOUT_SEC
             )
             
-            state = dataset.get_state()
-            await self.send_response("sorted", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
-
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "header": rows["header"],
-                "rows": rows["rows"],
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_view("sorted", dataset)
 
         except asyncio.TimeoutError:
             await self.send_error("Sort operation timed out.", action="sorted")
@@ -313,22 +461,7 @@ class WebSocketHandler:
             else:
                 dataset.clear_filter()
 
-            state = dataset.get_state()
-            await self.send_response("filtered", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
-
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "header": rows["header"],
-                "rows": rows["rows"],
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_view("filtered", dataset)
 
         except asyncio.TimeoutError:
             await self.send_error("Filter operation timed out.", action="filtered")
@@ -339,7 +472,7 @@ class WebSocketHandler:
 
     async def handle_apply_filter(self, filter_payload: dict | None):
         """Handle apply_filter command."""
-        logger.info(f"Handling apply_filter with payload: {filter_payload}")
+        logger.info("Handling apply_filter with payload: %s", filter_payload)
         dataset = _get_dataset_or_none()
         if dataset is None:
             await self.send_error("No dataset loaded", action="filtered")
@@ -353,23 +486,7 @@ class WebSocketHandler:
             )
 
             # Return updated state and rows
-            state = dataset.get_state()
-            await self.send_response("filtered", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
-
-            # Send the filtered rows
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "header": rows["header"],
-                "rows": rows["rows"],
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_view("filtered", dataset)
 
         except asyncio.TimeoutError:
             await self.send_error("Filter operation timed out.", action="filtered")
@@ -387,22 +504,7 @@ class WebSocketHandler:
 
         try:
             dataset.reset()
-            state = dataset.get_state()
-            await self.send_response("reset", {
-                "success": True,
-                "state": state,
-                "total": dataset.row_count,
-            })
-
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "header": rows["header"],
-                "rows": rows["rows"],
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_view("reset", dataset)
 
         except Exception as e:
             await self.send_error(f"Reset failed: {e}", action="reset")
@@ -415,11 +517,15 @@ class WebSocketHandler:
             return
 
         try:
-            # Run analysis in a separate thread to avoid blocking the event loop
-            data = await asyncio.wait_for(
-                asyncio.to_thread(dataset.get_column_frequency, column),
-                timeout=OPERATION_TIMEOUT_SEC
-            )
+            # A cached ranking only needs its top values formatted; no need
+            # for a thread
+            data = dataset.cached_column_frequency(column)
+            if data is None:
+                # Run analysis in a separate thread to avoid blocking the event loop
+                data = await asyncio.wait_for(
+                    asyncio.to_thread(dataset.get_column_frequency, column),
+                    timeout=OPERATION_TIMEOUT_SEC
+                )
             await self.send_response("analysis_result", {
                 "column": column,
                 "data": data
@@ -431,15 +537,57 @@ class WebSocketHandler:
         except Exception as e:
             await self.send_error(f"Analysis failed: {e}", action="analysis_result")
 
+    async def send_stats(self, column: str, req_id: int | None, data: Any, **flags: bool):
+        """Send a stats_result; flags mark a reply without data (timed_out, dropped)."""
+        response_data = {
+            "column": column,
+            "data": data,
+            **flags,
+        }
+        if req_id is not None:
+            response_data["req_id"] = req_id
+        await self.send_response("stats_result", response_data)
+
+    def _forget_stats_task(self, column: str):
+        """Stop tracking the current task's stats request (it is being answered)."""
+        entry = self.active_stats_tasks.get(column)
+        if entry is not None and entry[0] is asyncio.current_task():
+            del self.active_stats_tasks[column]
+
+    async def _stats_in_thread(self, dataset: DatasetHandle, column: str) -> dict[str, Any]:
+        """
+        Compute column stats in a worker thread, at most
+        MAX_CONCURRENT_STATS at a time per connection.
+
+        Cancelling the caller cannot stop the thread, so the slot is only
+        released once the thread itself returns.
+        """
+        def finished(job: asyncio.Task):
+            self.stats_slots.release()
+            if not job.cancelled():
+                job.exception()  # Retrieved here in case the caller is gone
+
+        await self.stats_slots.acquire()
+        job = asyncio.create_task(asyncio.to_thread(dataset.get_column_stats_sample, column))
+        job.add_done_callback(finished)
+        return await asyncio.shield(job)
+
     async def handle_get_stats(self, column: str, req_id: int | None = None, force: bool = False):
         """Handle get_stats command (quick column summary)."""
         # Request Coalescing: If a task for this column is already running, skip
         if column in self.active_stats_tasks and not force:
-            logger.info(f"Coalescing stats request for column: {column}")
+            logger.info("Coalescing stats request for column: %s", column)
+            return
+
+        # Cached stats are answered inline, without a task or a thread
+        dataset = _get_dataset_or_none()
+        data = None if dataset is None else dataset.cached_column_stats(column)
+        if data is not None:
+            await self.send_stats(column, req_id, data)
             return
 
         async def fetch_and_send():
-            logger.info(f"Task started: stats for {column}")
+            logger.info("Task started: stats for %s", column)
             try:
                 dataset = _get_dataset_or_none()
                 if dataset is None:
@@ -449,47 +597,45 @@ class WebSocketHandler:
                 # Run stats in a separate thread with timeout
                 try:
                     data = await asyncio.wait_for(
-                        asyncio.to_thread(dataset.get_column_stats_sample, column),
+                        self._stats_in_thread(dataset, column),
                         timeout=OPERATION_TIMEOUT_SEC
                     )
-                    logger.info(f"Task finished: stats for {column}")
-                    
-                    # Minimal response payload
-                    response_data = {
-                        "column": column,
-                        "data": data
-                    }
-                    if req_id is not None:
-                        response_data["req_id"] = req_id
-
-                    await self.send_response("stats_result", response_data)
+                    logger.info("Task finished: stats for %s", column)
+                    self._forget_stats_task(column)
+                    await self.send_stats(column, req_id, data)
 
                 except asyncio.TimeoutError:
-                    logger.warning(f"Task timeout: stats for {column}")
+                    logger.warning("Task timeout: stats for %s", column)
                     # Return placeholder stats on timeout
-                    response_data = {
-                        "column": column,
-                        "data": None,
-                        "timed_out": True
-                    }
-                    if req_id is not None:
-                        response_data["req_id"] = req_id
-                    
-                    await self.send_response("stats_result", response_data)
-                    
+                    self._forget_stats_task(column)
+                    await self.send_stats(column, req_id, None, timed_out=True)
+
             except ValueError as e:
-                logger.error(f"Task error: stats for {column} - {e}")
+                logger.error("Task error: stats for %s - %s", column, e)
                 await self.send_error(str(e), action="stats_result")
             except Exception as e:
-                logger.error(f"Task failed: stats for {column} - {e}")
+                logger.error("Task failed: stats for %s - %s", column, e)
                 await self.send_error(f"Stats failed: {e}", action="stats_result")
             finally:
-                # Remove self from active tasks
-                self.active_stats_tasks.pop(column, None)
+                # Remove self from active tasks (unless a forced request replaced it)
+                self._forget_stats_task(column)
+
+        # A forced request replaces the column's pending one; beyond
+        # MAX_CONCURRENT_STATS columns, the oldest request is dropped.
+        # Either way the dropped request still gets a reply.
+        dropped = []
+        previous = self.active_stats_tasks.pop(column, None)
+        if previous is not None:
+            dropped.append((column, previous))
+        while len(self.active_stats_tasks) >= MAX_CONCURRENT_STATS:
+            dropped.append(self.active_stats_tasks.popitem(last=False))
 
         # Create and track the task
         task = asyncio.create_task(fetch_and_send())
-        self.active_stats_tasks[column] = task
+        self.active_stats_tasks[column] = (task, req_id)
+        for dropped_column, (dropped_task, dropped_req_id) in dropped:
+            dropped_task.cancel()
+            await self.send_stats(dropped_column, dropped_req_id, None, dropped=True)
         # Note: We do NOT await the task here, allowing the loop to process other messages
 
     async def handle_rename_col(self, col_id: str, new_name: str):
@@ -503,25 +649,10 @@ class WebSocketHandler:
             await asyncio.to_thread(dataset.rename_column, col_id, new_name)
             
             # Return updated columns
-            columns = [
-                {"name": c.name, "type": c.type, "width": c.width}
-                for c in dataset.get_columns()
-            ]
-            await self.send_response("columns", {
-                "columns": columns,
-                "count": len(columns)
-            })
+            await self.send_columns(dataset)
             
             # Also refresh rows header
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "header": rows["header"],
-                "rows": rows["rows"],
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_first_page(dataset)
 
         except ValueError as e:
             await self.send_error(str(e), action="rename_col")
@@ -543,25 +674,10 @@ class WebSocketHandler:
             )
             
             # Return updated columns
-            columns = [
-                {"name": c.name, "type": c.type, "width": c.width}
-                for c in dataset.get_columns()
-            ]
-            await self.send_response("columns", {
-                "columns": columns,
-                "count": len(columns)
-            })
+            await self.send_columns(dataset)
             
             # Refresh rows with new types
-            rows = dataset.get_rows(start=0, limit=100)
-            await self.send_response("rows", {
-                "header": rows["header"],
-                "rows": rows["rows"],
-                "start": 0,
-                "limit": 100,
-                "total": dataset.row_count,
-                "reset": True
-            })
+            await self.send_first_page(dataset)
 
         except asyncio.TimeoutError:
             await self.send_error("Type change timed out.", action="set_col_type")
@@ -570,91 +686,97 @@ class WebSocketHandler:
         except Exception as e:
             await self.send_error(f"Type change failed: {e}", action="set_col_type")
 
+    # Command table, built once: each action's handler and the message
+    # parameters it requires; handle_command checks them in one pass.
+    _DISPATCH: dict[str, Cmd] = {
+        "get_columns": Cmd(lambda self, msg: self.handle_get_columns()),
+        "get_rows": Cmd(
+            lambda self, msg: self.handle_get_rows(
+                msg.get("start", 0),
+                msg.get("limit", 50),
+                msg.get("format") == "columnar",
+            ),
+            err_action="rows",
+            ints=("start", "limit"),
+        ),
+        "get_info": Cmd(lambda self, msg: self.handle_get_info()),
+        "load": Cmd(
+            lambda self, msg: self.handle_load(msg["path"]),
+            required=("path",),
+            err_action="loaded",
+        ),
+        "sort": Cmd(
+            lambda self, msg: self.handle_sort(
+                msg["column"],
+                msg.get("ascending", True),
+            ),
+            required=("column",),
+            err_action="sorted",
+        ),
+        "filter": Cmd(
+            lambda self, msg: self.handle_filter(
+                msg["column"],
+                msg.get("term", ""),
+            ),
+            required=("column",),
+            err_action="filtered",
+        ),
+        "apply_filter": Cmd(lambda self, msg: self.handle_apply_filter(msg.get("filter_payload"))),
+        "reset": Cmd(lambda self, msg: self.handle_reset()),
+        "analyze": Cmd(
+            lambda self, msg: self.handle_analyze(msg["column"]),
+            required=("column",),
+            err_action="analysis_result",
+        ),
+        "get_stats": Cmd(
+            lambda self, msg: self.handle_get_stats(
+                msg["column"],
+                msg.get("req_id"),
+                msg.get("force", False),
+            ),
+            required=("column",),
+            err_action="stats_result",
+        ),
+        "ping": Cmd(lambda self, msg: self.websocket.send_text(_PONG)),
+        "rename_col": Cmd(
+            lambda self, msg: self.handle_rename_col(msg["col_id"], msg["new_name"]),
+            required=("col_id", "new_name"),
+            err_action="rename_col",
+            missing_message="Missing parameters",
+        ),
+        "set_col_type": Cmd(
+            lambda self, msg: self.handle_set_col_type(msg["col_id"], msg["type"]),
+            required=("col_id", "type"),
+            err_action="set_col_type",
+            missing_message="Missing parameters",
+        ),
+    }
+
     async def handle_command(self, message: dict):
         """Route a command to the appropriate handler."""
         action = message.get("action")
-        logger.info(f"Received command action: {action}")
-
-        handlers = {
-                "get_columns": (
-                    lambda msg: self.handle_get_columns()
-                ),
-                "get_rows": (
-                    lambda msg: self.handle_get_rows(
-                        msg.get("start", 0),
-                        msg.get("limit", 50),
-                    )
-                ),
-                "get_info": (
-                    lambda msg: self.handle_get_info()
-                ),
-                "load": (
-                    lambda msg: self.handle_load(msg.get("path"))
-                    if msg.get("path")
-                    else self.send_error("Missing 'path' parameter", action="loaded")
-                ),
-                "sort": (
-                    lambda msg: self.handle_sort(
-                        msg.get("column"),
-                        msg.get("ascending", True),
-                    )
-                    if msg.get("column")
-                    else self.send_error("Missing 'column' parameter", action="sorted")
-                ),
-                "filter": (
-                    lambda msg: self.handle_filter(
-                        msg.get("column"),
-                        msg.get("term", ""),
-                    )
-                    if msg.get("column")
-                    else self.send_error("Missing 'column' parameter", action="filtered")
-                ),
-                "apply_filter": (
-                    lambda msg: self.handle_apply_filter(msg.get("filter_payload"))
-                ),
-                "reset": (
-                    lambda msg: self.handle_reset()
-                ),
-                "analyze": (
-                    lambda msg: self.handle_analyze(msg.get("column"))
-                    if msg.get("column")
-                    else self.send_error("Missing 'column' parameter", action="analysis_result")
-                ),
-                "get_stats": (
-                    lambda msg: self.handle_get_stats(
-                        msg.get("column"),
-                        msg.get("req_id"),
-                        msg.get("force", False)
-                    )
-                    if msg.get("column")
-                    else self.send_error("Missing 'column' parameter", action="stats_result")
-                ),
-                "ping": (
-                    lambda msg: self.send_response("pong")
-                ),
-                "rename_col": (
-                    lambda msg: self.handle_rename_col(
-                        msg.get("col_id"),
-                        msg.get("new_name")
-                    )
-                    if msg.get("col_id") and msg.get("new_name")
-                    else self.send_error("Missing parameters", action="rename_col")
-                ),
-                "set_col_type": (
-                    lambda msg: self.handle_set_col_type(
-                        msg.get("col_id"),
-                        msg.get("type")
-                    )
-                    if msg.get("col_id") and msg.get("type")
-                    else self.send_error("Missing parameters", action="set_col_type")
-                ),
-        }
+        logger.info("Received command action: %s", action)
 
-        handler = handlers.get(action)
-        if handler:
-            await handler(message)
-        else:
+        cmd = self._DISPATCH.get(action)
+        if cmd is None:
             await self.send_error(f"Unknown action: {action}")
+            return
+        for key in cmd.required:
+            if not message.get(key):
+                await self.send_error(cmd.missing_error, action=cmd.err_action)
+                return
+        for key in cmd.ints:
+            value = message.get(key)
+            if value is not None and type(value) is not int:
+                await self.send_error(f"Invalid '{key}' parameter: expected an integer", action=cmd.err_action)
+                return
+
+        if action in ("filter", "apply_filter"):
+            self.queue_filter(lambda: cmd.fn(self, message))
+            return
+        if action != "ping":
+            await self.wait_for_filters()
+        await cmd.fn(self, message)
 
 
 def create_app() -> FastAPI:
@@ -666,15 +788,24 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # CORS middleware
+    # Serializes "load" commands across connections; other commands read
+    # the current dataset without locking
+    app.state.load_lock = asyncio.Lock()
+
+    # CORS middleware: only the Vite dev server is cross-origin (the built
+    # frontend is served from this app, and WebSockets bypass CORS)
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=DEV_ORIGINS,
+        allow_methods=["GET"],
+        allow_headers=["content-type"],
+        max_age=86400,
     )
 
+    # Compress the frontend bundle over HTTP; WebSocket frames are
+    # compressed by uvicorn's permessage-deflate instead
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # WebSocket endpoint
     @app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -684,47 +815,60 @@ def create_app() -> FastAPI:
         logger.info("WebSocket client connected")
 
         # Send server restart/hello event
-        await handler.send_response("server_restart", {
-            "session_id": SERVER_SESSION_ID,
-            "message": "Server ready"
-        })
+        await websocket.send_text(_SERVER_RESTART)
 
         try:
             while True:
+                # Decode the raw frame with orjson; it accepts both the text
+                # frames the frontend sends and binary frames.
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000), frame.get("reason"))
                 try:
-                    message = await websocket.receive_json()
-                except json.JSONDecodeError:
+                    message = orjson.loads(frame.get("bytes") or frame.get("text") or b"")
+                except orjson.JSONDecodeError:
                     await handler.send_error("Invalid JSON")
                     continue
+                if not isinstance(message, dict):
+                    await handler.send_error("Invalid message: expected a JSON object")
+                    continue
+
+                # Keep-alives skip the command table (and queued filters)
+                if message.get("action") == "ping":
+                    await websocket.send_text(_PONG)
+                    continue
 
                 await handler.handle_command(message)
 
         except WebSocketDisconnect:
             logger.info("WebSocket client disconnected")
             # Cancel active tasks
-            for task in handler.active_stats_tasks.values():
+            for task, _ in handler.active_stats_tasks.values():
                 task.cancel()
+            if handler.filter_task is not None:
+                handler.filter_task.cancel()
         except Exception as e:
-            logger.error(f"WebSocket error: {e}")
+            logger.error("WebSocket error: %s", e)
             # Cancel active tasks
-            for task in handler.active_stats_tasks.values():
+            for task, _ in handler.active_stats_tasks.values():
                 task.cancel()
+            if handler.filter_task is not None:
+                handler.filter_task.cancel()
 
     # Serve static frontend files
     # The static directory should contain the built React app
     static_dir = Path(__file__).parent / "static"
     if static_dir.exists():
-        app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+        app.mount("/", _FrontendStaticFiles(directory=str(static_dir), html=True), name="static")
     else:
         @app.get("/")
         async def root():
-            return {
-                "error": "Frontend not built",
-                "message": "Run 'npm run build' in the frontend directory and copy dist/* to vdweb/static/"
-            }
+            return Response(_STATIC_MISSING, media_type="application/json")
 
     return app
 
 
 # For development: python -m uvicorn vdweb.server:app --reload
+# (uvicorn[standard], a dependency, brings uvloop and httptools; uvicorn
+# picks them automatically)
 app = create_app()